@@ -1,16 +1,106 @@
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox, colorchooser
-from PIL import Image, ImageTk, ImageDraw, ImageFont
+from tkinter import font as tkfont
+from PIL import Image, ImageTk, ImageDraw
+import concurrent.futures
+import functools
 import math
 import json
 import os
-import csv
-from datetime import datetime
+import types
 try:
     from tkinterdnd2 import DND_FILES, TkinterDnD
     DND_AVAILABLE = True
 except ImportError:
     DND_AVAILABLE = False
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Factors to the canonical internal unit (meters). Stored measurement
+# distances are always meters; display units are applied at render time.
+_UNIT_TO_M = {
+    "meters": 1.0,
+    "centimeters": 0.01,
+    "feet": 0.3048,
+    "inches": 0.0254
+}
+
+# Small integer IDs per unit and a direct any-to-any factor matrix derived
+# from the canonical table, so a conversion is one indexed multiply instead
+# of two dict lookups through an intermediate unit
+_UNIT_IDX = {"meters": 0, "centimeters": 1, "feet": 2, "inches": 3}
+_UNITS = ("meters", "centimeters", "feet", "inches")
+_CONV = [[_UNIT_TO_M[a] / _UNIT_TO_M[b] for b in _UNITS] for a in _UNITS]
+# Meters-per-unit indexed by unit id, for paths that carry an id
+_M_PER_UNIT = tuple(_UNIT_TO_M[u] for u in _UNITS)
+
+# Canonical defaults, shared by startup and Reset to Defaults; the proxy
+# keeps accidental mutation of the template impossible
+_DEFAULT_SETTINGS = types.MappingProxyType({
+    'calibration_line_color': '#FF0000',  # Red
+    'calibration_point_color': '#FF0000',
+    'calibration_line_width': 2,
+    'measurement_line_color': '#0000FF',  # Blue
+    'measurement_point_color': '#0000FF',
+    'measurement_line_width': 2,
+    'measurement_text_color': '#0000FF',
+    'measurement_text_size': 10,
+    'measurement_text_font': 'Arial',
+    'canvas_bg_color': '#808080',  # Gray
+    'point_size': 4,
+    'show_measurement_labels': True,
+    'label_background': True,
+    'label_bg_color': '#FFFFFF',
+    'grid_enabled': False,
+    'grid_color': '#CCCCCC',
+    'grid_spacing': 50,
+    'show_crosshair': True,
+    'crosshair_color': '#00FF00',  # Green
+    'crosshair_width': 1,
+    'show_rulers': True,
+    'ruler_color': '#000000',
+    'ruler_bg_color': '#E0E0E0',
+    'ruler_size': 30
+})
+
+# Settings that change what the canvas shows; edits limited to other keys
+# (grid placeholders, canvas background, which is applied via config)
+# don't need a redraw when the preferences dialog is saved
+_AFFECTS_DISPLAY = frozenset((
+    'calibration_line_color', 'calibration_point_color',
+    'calibration_line_width',
+    'measurement_line_color', 'measurement_point_color',
+    'measurement_line_width', 'measurement_text_color',
+    'measurement_text_size', 'measurement_text_font',
+    'point_size', 'show_measurement_labels', 'label_background',
+    'label_bg_color', 'show_crosshair', 'crosshair_color',
+    'crosshair_width', 'show_rulers', 'ruler_color', 'ruler_bg_color',
+    'ruler_size',
+))
+
+
+@functools.lru_cache(maxsize=256)
+def _rgb(color):
+    """Hex/named color to an RGB tuple, parsed once per distinct color"""
+    from PIL import ImageColor
+    return ImageColor.getrgb(color)
+
+
+@functools.lru_cache(maxsize=32)
+def _get_export_font(path, size):
+    """Load a truetype font once per (path, size).
+
+    Parsing a TTF is file I/O plus parser work; exports reuse the cached
+    font object instead of re-reading it every time.
+    """
+    from PIL import ImageFont
+    try:
+        return ImageFont.truetype(path, size)
+    except OSError:
+        return ImageFont.load_default()
 
 
 class BlueprintMeasurementTool:
@@ -22,22 +112,44 @@ class BlueprintMeasurementTool:
         
         # Variables
         self.image = None
+        self.image_path = None
         self.photo = None
         self.canvas_image = None
-        self.scale_factor = None  # pixels per unit at current zoom
-        self.base_scale_factor = None  # pixels per unit at zoom level 1.0
+        self.scale_factor = None  # canvas pixels per unit at current zoom
+        self.base_scale_factor = None  # canvas pixels per unit at zoom level 1.0
+        self.image_scale_factor = None  # source-image pixels per unit
         self.calibration_zoom_level = 1.0  # zoom level when calibration was done
         self.calibration_points = []
         self.current_line_points = []
         self.measurements = []  # Store all measurements
+        self._segments = []  # flat (x1, y1, x2, y2) sidecar for hot paths
+        self._distances = []  # flat stored-distance sidecar, same order
+        self._segments_dirty = False
+        self._ruler_cache = {}  # rendered ruler strips keyed by zoom/range
+        self._ruler_range = None  # (zoom, x1, x2, y1, y2) covered by drawn strips
+        self._scroll_region = None  # parsed scrollregion floats
+        self._fmt2 = "{:.2f}".format  # cached coordinate formatter
+        self._last_ruler_ixy = None  # last drawn ruler readout, in 0.01 units
+        self._ruler_strip_font = None  # PIL font shared by all strip renders
+        self._label_font = None  # cached Tk font for measurement labels
+        self._small_font = None  # cached Tk font for snap/ruler readouts
+        self._display_update_pending = False  # coalesced panel updates
+        self._move_pending = None  # after() handle for coalesced mouse moves
+        self._last_move_event = None  # most recent motion event while pending
+        self._current_point_ids = []  # ovals of the in-progress measurement
         self.mode = "calibrate"  # "calibrate" or "measure"
         self.unit = "meters"  # default unit
+        self.unit_id = 0  # integer index into _CONV for the unit above
+        self.display_unit_id = 0  # ditto for the display-unit picker
         
         # Zoom variables
         self.zoom_level = 1.0
         self.min_zoom = 0.1
         self.max_zoom = 10.0
         self.zoom_step = 0.1
+        self._pending_zoom = None  # coalesced wheel-zoom target
+        self._pending_zoom_anchor = None
+        self._zoom_after_id = None
         
         # Canvas offset for centering
         self.offset_x = 0
@@ -45,41 +157,57 @@ class BlueprintMeasurementTool:
         
         # Store original image size
         self.original_image = None
-        self.base_scale = 1.0  # Base scale to fit canvas
+        self._pyramid = []  # powers-of-two downscales of the original image
+        self.base_scale = None  # Base scale to fit canvas (set on load)
+        self._last_render_key = None  # (image, zoom, canvas size) memo
         
         # Default settings
-        self.settings = {
-            'calibration_line_color': '#FF0000',  # Red
-            'calibration_point_color': '#FF0000',
-            'calibration_line_width': 2,
-            'measurement_line_color': '#0000FF',  # Blue
-            'measurement_point_color': '#0000FF',
-            'measurement_line_width': 2,
-            'measurement_text_color': '#0000FF',
-            'measurement_text_size': 10,
-            'measurement_text_font': 'Arial',
-            'canvas_bg_color': '#808080',  # Gray
-            'point_size': 4,
-            'show_measurement_labels': True,
-            'label_background': True,
-            'label_bg_color': '#FFFFFF',
-            'grid_enabled': False,
-            'grid_color': '#CCCCCC',
-            'grid_spacing': 50,
-            'show_crosshair': True,
-            'crosshair_color': '#00FF00',  # Green
-            'crosshair_width': 1,
-            'show_rulers': True,
-            'ruler_color': '#000000',
-            'ruler_bg_color': '#E0E0E0',
-            'ruler_size': 30
-        }
-        
+        self.settings = dict(_DEFAULT_SETTINGS)
+        
+        self._settings_widgets = {}  # dialog widget references
+        self._settings_vars = {}  # persistent dialog Vars, created once
+        self._settings_refreshers = []  # callbacks syncing widgets from settings
+        self._settings_window = None
+        self._settings_before = None  # settings snapshot at dialog open
+        self._settings_save_after = None  # debounce timer for disk writes
+        self._export_executor = None  # lazy single worker for image encoding
+        self._last_saved_settings = None  # snapshot of what's on disk
         self.load_settings()
+        self._refresh_setting_cache()
         self.setup_ui()
         self.setup_menu()
         self.setup_keyboard_shortcuts()
-        
+        # Pay first-use costs now, while the window is still coming up,
+        # instead of on the first click or ruler render
+        self.root.after_idle(self._warm_caches)
+        # Flush any pending settings write before the window goes away
+        self.root.protocol("WM_DELETE_WINDOW", self._on_close)
+
+    def _on_close(self):
+        """Flush pending state and tear the window down"""
+        if self._settings_save_after is not None:
+            self.root.after_cancel(self._settings_save_after)
+            self._settings_save_after = None
+        self._flush_settings()
+        if self._export_executor is not None:
+            # Let an in-flight export finish writing before exit
+            self._export_executor.shutdown(wait=True)
+        self.root.destroy()
+
+    def _warm_caches(self):
+        """Pre-build lazily created resources during startup idle time.
+
+        The label font (a Tcl font parse plus metrics queries) and the
+        PIL ruler font otherwise get built on the first measurement click
+        or the first ruler strip render, adding a small hitch to the
+        first interaction.
+        """
+        font = self._get_label_font()
+        font.metrics('linespace')
+        if self._ruler_strip_font is None:
+            from PIL import ImageFont
+            self._ruler_strip_font = ImageFont.load_default()
+
     def setup_menu(self):
         """Setup menu bar"""
         menubar = tk.Menu(self.root)
@@ -89,11 +217,12 @@ class BlueprintMeasurementTool:
         file_menu = tk.Menu(menubar, tearoff=0)
         menubar.add_cascade(label="File", menu=file_menu)
         file_menu.add_command(label="Open Image", command=self.load_image, accelerator="Ctrl+O")
+        file_menu.add_command(label="Load Full Resolution", command=self.load_full_resolution)
         file_menu.add_separator()
         file_menu.add_command(label="Export Labelled Image", command=self.export_image, accelerator="Ctrl+S")
         file_menu.add_command(label="Export Measurements (CSV)", command=self.export_measurements_csv)
         file_menu.add_separator()
-        file_menu.add_command(label="Exit", command=self.root.quit, accelerator="Ctrl+Q")
+        file_menu.add_command(label="Exit", command=self._on_close, accelerator="Ctrl+Q")
         
         # Edit menu
         edit_menu = tk.Menu(menubar, tearoff=0)
@@ -184,10 +313,10 @@ class BlueprintMeasurementTool:
             self.canvas.drop_target_register(DND_FILES)
             self.canvas.dnd_bind('<<Drop>>', self.on_drop)
         
-        h_scrollbar = ttk.Scrollbar(canvas_frame, orient=tk.HORIZONTAL, 
-                                    command=self.canvas.xview)
-        v_scrollbar = ttk.Scrollbar(canvas_frame, orient=tk.VERTICAL, 
-                                    command=self.canvas.yview)
+        h_scrollbar = ttk.Scrollbar(canvas_frame, orient=tk.HORIZONTAL,
+                                    command=self._canvas_xview)
+        v_scrollbar = ttk.Scrollbar(canvas_frame, orient=tk.VERTICAL,
+                                    command=self._canvas_yview)
         
         self.canvas.configure(xscrollcommand=h_scrollbar.set, 
                             yscrollcommand=v_scrollbar.set)
@@ -213,7 +342,8 @@ class BlueprintMeasurementTool:
         
         self.selected_measurement_index = None
         self.crosshair_visible = False
-        self.shift_pressed = False
+        self._crosshair_h = None  # reusable crosshair line items
+        self._crosshair_v = None
         
         # Right side - Info panel
         info_frame = ttk.Frame(main_container, width=300)
@@ -258,7 +388,7 @@ class BlueprintMeasurementTool:
                                          values=["meters", "centimeters", "feet", "inches"],
                                          width=12, state="readonly")
         display_unit_combo.pack(side=tk.LEFT, padx=5)
-        display_unit_combo.bind("<<ComboboxSelected>>", self.update_measurements_display)
+        display_unit_combo.bind("<<ComboboxSelected>>", self.on_display_unit_change)
         
         # Scrolled text for measurements
         text_frame = ttk.Frame(measure_frame)
@@ -287,7 +417,7 @@ Instructions:
         ttk.Label(info_frame, text=instructions, justify=tk.LEFT, 
                  wraplength=280, font=("Arial", 9)).pack(side=tk.BOTTOM, pady=10)
     
-    def load_image(self, file_path=None):
+    def load_image(self, file_path=None, full_resolution=False):
         if not file_path:
             file_path = filedialog.askopenfilename(
                 title="Select Blueprint Image",
@@ -297,9 +427,29 @@ Instructions:
         
         if file_path:
             try:
+                self.image_path = file_path
                 self.original_image = Image.open(file_path)
-                self.image = self.original_image.copy()
+                if not full_resolution:
+                    # Let libjpeg decode straight to a reduced DCT scale for
+                    # huge JPEGs (a no-op for other formats). 4x the canvas
+                    # leaves plenty of headroom for zooming in; use
+                    # File > Load Full Resolution when every pixel matters.
+                    canvas_width = self.canvas.winfo_width()
+                    canvas_height = self.canvas.winfo_height()
+                    if canvas_width <= 1:
+                        canvas_width = 800
+                    if canvas_height <= 1:
+                        canvas_height = 600
+                    self.original_image.draft('RGB', (canvas_width * 4,
+                                                      canvas_height * 4))
+                # Force the decode now, and share the single decoded image:
+                # nothing mutates self.image, so a full copy would only
+                # double memory for large blueprints
+                self.original_image.load()
+                self.image = self.original_image
+                self._build_pyramid()
                 self.zoom_level = 1.0
+                self.base_scale = None  # refit the new image to the canvas
                 self.display_image()
                 self.reset_calibration()
                 messagebox.showinfo("Image Loaded", 
@@ -307,6 +457,36 @@ Instructions:
             except Exception as e:
                 messagebox.showerror("Error", f"Failed to load image: {str(e)}")
     
+    def load_full_resolution(self):
+        """Reload the current image without the reduced-scale draft decode"""
+        if self.image_path:
+            self.load_image(self.image_path, full_resolution=True)
+
+    def _build_pyramid(self):
+        """Build a powers-of-two downscale pyramid for the loaded image.
+
+        Resizing for display always starts from the smallest pyramid level
+        that is still at least the target size, so zooming out never re-runs
+        an expensive resample over the full-resolution source. The pyramid
+        is rebuilt only when a new image is loaded.
+        """
+        self._ruler_cache.clear()
+        self._pyramid = [self.original_image]
+        img = self.original_image
+        while img.size[0] >= 1024:
+            img = img.reduce(2)  # fast integer box downscale
+            self._pyramid.append(img)
+
+    def _pyramid_source(self, target_width):
+        """Return the smallest pyramid level still >= target_width wide."""
+        src = self.original_image
+        for level in getattr(self, '_pyramid', [self.original_image]):
+            if level.size[0] >= target_width:
+                src = level
+            else:
+                break
+        return src
+
     def on_drop(self, event):
         """Handle drag and drop of files"""
         # Get the dropped file path
@@ -324,7 +504,7 @@ Instructions:
                 messagebox.showwarning("Invalid File", 
                                       "Please drop a valid image file (PNG, JPG, BMP, GIF, or TIFF).")
     
-    def display_image(self, keep_view_position=False):
+    def display_image(self, keep_view_position=False, rebuild_overlays=True):
         if self.original_image:
             # Store current center position if needed
             if keep_view_position:
@@ -340,41 +520,57 @@ Instructions:
             if canvas_height <= 1:
                 canvas_height = 600
             
-            # Calculate base scaling to fit canvas (first time only)
+            # Fit the image to the canvas once per load, not per redraw
             img_width, img_height = self.original_image.size
-            if self.base_scale == 1.0:
-                scale_w = canvas_width / img_width
-                scale_h = canvas_height / img_height
-                self.base_scale = min(scale_w, scale_h, 1.0)
+            if self.base_scale is None:
+                self._fit_base_scale(img_width, img_height,
+                                     canvas_width, canvas_height)
             
             # Apply zoom to base scale
             final_scale = self.base_scale * self.zoom_level
-            
+
             new_width = int(img_width * final_scale)
             new_height = int(img_height * final_scale)
-            
-            # Resize image
-            display_img = self.original_image.resize((new_width, new_height), 
-                                                     Image.Resampling.LANCZOS)
-            
-            self.photo = ImageTk.PhotoImage(display_img)
-            
-            # Store current canvas items
-            saved_items = self.save_canvas_items()
-            
-            # Clear canvas and display image
-            self.canvas.delete("all")
-            self.canvas_image = self.canvas.create_image(0, 0, anchor=tk.NW, image=self.photo)
-            
-            # Configure scroll region
-            self.canvas.configure(scrollregion=(0, 0, new_width, new_height))
-            
-            # Draw rulers if enabled
-            if self.settings['show_rulers']:
-                self.draw_rulers()
-            
-            # Restore canvas items (measurements, calibration lines)
-            self.restore_canvas_items(saved_items)
+
+            # Skip the resample entirely when nothing that affects the
+            # rendered image has changed since the last render
+            render_key = (id(self.original_image), self.zoom_level,
+                          canvas_width, canvas_height)
+            if render_key != self._last_render_key or self.photo is None:
+                self._render_display_image(new_width, new_height)
+                self._last_render_key = render_key
+
+            if not rebuild_overlays and self.canvas_image:
+                # Fast path (zoom): the caller has already moved the overlay
+                # items with canvas.scale, so just swap the image in place
+                # instead of wiping and recreating every canvas item
+                self.canvas.itemconfig(self.canvas_image, image=self.photo)
+                self.canvas.configure(scrollregion=(0, 0, new_width, new_height))
+                self._scroll_region = (0, 0, new_width, new_height)
+                self.canvas.delete("ruler")
+                if self.settings['show_rulers']:
+                    self.draw_rulers()
+            else:
+                # Store current canvas items
+                saved_items = self.save_canvas_items()
+
+                # Clear canvas and display image
+                self.canvas.delete("all")
+                self._crosshair_h = self._crosshair_v = None
+                self._last_ruler_ixy = None
+                self._current_point_ids = []
+                self.canvas_image = self.canvas.create_image(0, 0, anchor=tk.NW, image=self.photo)
+
+                # Configure scroll region
+                self.canvas.configure(scrollregion=(0, 0, new_width, new_height))
+                self._scroll_region = (0, 0, new_width, new_height)
+
+                # Draw rulers if enabled
+                if self.settings['show_rulers']:
+                    self.draw_rulers()
+
+                # Restore canvas items (measurements, calibration lines)
+                self.restore_canvas_items(saved_items)
             
             # Update zoom label
             self.zoom_label.config(text=f"Zoom: {int(self.zoom_level * 100)}%")
@@ -392,110 +588,220 @@ Instructions:
                 self.canvas.xview_moveto(max(0, x_frac - 0.5))
                 self.canvas.yview_moveto(max(0, y_frac - 0.5))
     
+    def _fit_base_scale(self, img_width, img_height, canvas_width, canvas_height):
+        """Compute the base scale that fits the image inside the canvas"""
+        scale_w = canvas_width / img_width
+        scale_h = canvas_height / img_height
+        self.base_scale = min(scale_w, scale_h, 1.0)
+
+    def _render_display_image(self, new_width, new_height):
+        """Resample the source image into self.photo at the given size"""
+        # Resize from the nearest pyramid level instead of the full-size
+        # original, so zoomed-out renders touch far fewer pixels
+        src = self._pyramid_source(new_width)
+        if new_width > 0 and src.size[0] >= new_width * 2:
+            # Still shrinking by 2x or more (below the smallest pyramid
+            # level): a fast integer box reduce gets within 2x of the
+            # target before the filtered resize does the final step
+            src = src.reduce(src.size[0] // new_width)
+        display_img = src.resize((new_width, new_height),
+                                 self._resample_filter())
+
+        # Reuse the existing PhotoImage buffer when the render size is
+        # unchanged; repeated PhotoImage allocation is slow on some Tk
+        # builds and churns memory. A size change still reallocates
+        # (pasting into a differently sized buffer would show stale edges).
+        if (self.photo is not None
+                and self.photo.width() == new_width
+                and self.photo.height() == new_height):
+            self.photo.paste(display_img)
+        else:
+            self.photo = ImageTk.PhotoImage(display_img)
+
+    def _resample_filter(self):
+        """Pick the resampling filter for the current zoom level.
+
+        LANCZOS looks best when zoomed in, but when zoomed out the quality
+        difference is invisible and BILINEAR is several times cheaper per
+        resize, so wheel zooming stays responsive on large blueprints.
+        """
+        if self.zoom_level < 1.0:
+            return Image.Resampling.BILINEAR
+        return Image.Resampling.LANCZOS
+
     def draw_rulers(self):
         """Draw ruler markings on canvas edges"""
         # Clear existing rulers first
         self.canvas.delete("ruler")
-        
+        self._ruler_range = None
+
         if not self.base_scale_factor:
             return
         
-        scroll_region = self.canvas.cget("scrollregion")
-        if not scroll_region:
+        if not self._scroll_region:
             return
-        
-        x1, y1, x2, y2 = map(float, scroll_region.split())
-        ruler_size = self.settings['ruler_size']
-        
+
+        x1, y1, x2, y2 = self._scroll_region
+
         # Get visible region
         canvas_width = self.canvas.winfo_width()
         canvas_height = self.canvas.winfo_height()
-        
+
         visible_x1 = self.canvas.canvasx(0)
         visible_x2 = self.canvas.canvasx(canvas_width)
         visible_y1 = self.canvas.canvasy(0)
         visible_y2 = self.canvas.canvasy(canvas_height)
-        
+
         # Calculate tick spacing in pixels based on scale
         # Aim for ticks every 50-100 pixels
-        unit_text = self.unit
-        if self.base_scale_factor:
-            # Calculate current scale factor based on zoom
-            current_scale_factor = self.base_scale_factor * self.zoom_level
-            # Try to get nice round numbers
-            real_per_100px = 100 / current_scale_factor
-            
-            # Find nice tick spacing (1, 2, 5, 10, 20, 50, 100, etc.)
-            nice_numbers = [0.1, 0.2, 0.5, 1, 2, 5, 10, 20, 50, 100, 200, 500, 1000]
-            tick_spacing_real = min(nice_numbers, key=lambda x: abs(x - real_per_100px))
-            tick_spacing_px = tick_spacing_real * current_scale_factor
-            
-            # Draw horizontal ruler (top)
-            x = 0
-            tick_num = 0
-            while x <= x2:
-                if visible_x1 <= x <= visible_x2:
-                    # Major tick every 5 intervals
-                    is_major = (tick_num % 5 == 0)
-                    tick_height = 15 if is_major else 8
-                    
-                    # Draw tick line on the image area
-                    self.canvas.create_line(
-                        x, y1, x, y1 + tick_height,
-                        fill=self.settings['ruler_color'],
-                        width=1,
-                        tags="ruler"
-                    )
-                    
-                    # Add label for major ticks
-                    if is_major:
-                        current_scale_factor = self.base_scale_factor * self.zoom_level
-                        real_distance = x / current_scale_factor
-                        self.canvas.create_text(
-                            x, y1 + tick_height + 8,
-                            text=f"{real_distance:.1f}",
-                            fill=self.settings['ruler_color'],
-                            font=("Arial", 7),
-                            tags="ruler"
-                        )
-                
-                x += tick_spacing_px
-                tick_num += 1
-            
-            # Draw vertical ruler (left)
-            y = 0
-            tick_num = 0
-            while y <= y2:
-                if visible_y1 <= y <= visible_y2:
-                    is_major = (tick_num % 5 == 0)
-                    tick_width = 15 if is_major else 8
-                    
-                    # Draw tick line
-                    self.canvas.create_line(
-                        x1, y, x1 + tick_width, y,
-                        fill=self.settings['ruler_color'],
-                        width=1,
-                        tags="ruler"
-                    )
-                    
-                    # Add label for major ticks
-                    if is_major:
-                        current_scale_factor = self.base_scale_factor * self.zoom_level
-                        real_distance = y / current_scale_factor
-                        self.canvas.create_text(
-                            x1 + tick_width + 12, y,
-                            text=f"{real_distance:.1f}",
-                            fill=self.settings['ruler_color'],
-                            font=("Arial", 7),
-                            angle=0,
-                            tags="ruler"
-                        )
-                
-                y += tick_spacing_px
-                tick_num += 1
-        
+        # Calculate current scale factor based on zoom
+        current_scale_factor = self.base_scale_factor * self.zoom_level
+        # Try to get nice round numbers
+        real_per_100px = 100 / current_scale_factor
+
+        # Find nice tick spacing (1, 2, 5, 10, 20, 50, 100, etc.)
+        tick_spacing_real = self._nice_tick_spacing(real_per_100px)
+        tick_spacing_px = tick_spacing_real * current_scale_factor
+
+        # Each ruler side is one pre-rendered image strip instead of a
+        # canvas item per tick/label; strips are cached per zoom and
+        # visible range so panning back re-uses a previous render. Render
+        # half a viewport of margin on each side so small pans stay inside
+        # the covered range and skip the redraw entirely
+        h_pad = canvas_width * 0.5
+        v_pad = canvas_height * 0.5
+        h_start, h_end = max(x1, visible_x1 - h_pad), min(x2, visible_x2 + h_pad)
+        v_start, v_end = max(y1, visible_y1 - v_pad), min(y2, visible_y2 + v_pad)
+
+        for axis, start, end, pos in (('x', h_start, h_end, y1),
+                                      ('y', v_start, v_end, x1)):
+            if end <= start:
+                continue
+            # Key on the ruler settings too, so a color or size change
+            # can't resurrect strips rendered with the old appearance
+            key = (axis, round(self.zoom_level, 4), int(start), int(end),
+                   self.settings['ruler_color'], self.settings['ruler_size'])
+            strip = self._ruler_cache.get(key)
+            if strip is None:
+                if len(self._ruler_cache) > 32:
+                    self._ruler_cache.clear()
+                strip = self._render_ruler_strip(axis, start, end,
+                                                 tick_spacing_px,
+                                                 current_scale_factor)
+                self._ruler_cache[key] = strip
+            if axis == 'x':
+                self.canvas.create_image(start, pos, anchor=tk.NW,
+                                         image=strip, tags="ruler")
+            else:
+                self.canvas.create_image(pos, start, anchor=tk.NW,
+                                         image=strip, tags="ruler")
+
         # Keep rulers on top of image
         self.canvas.tag_raise("ruler")
+
+        # Remember what the strips cover so scrolls within the padded
+        # range can skip the redraw
+        self._ruler_range = (round(self.zoom_level, 4),
+                             h_start, h_end, v_start, v_end)
+
+    def _rulers_cover_view(self):
+        """True if the drawn ruler strips already cover the visible range"""
+        if self._ruler_range is None:
+            return False
+        zoom, rx1, rx2, ry1, ry2 = self._ruler_range
+        if zoom != round(self.zoom_level, 4):
+            return False
+        vx1 = self.canvas.canvasx(0)
+        vx2 = self.canvas.canvasx(self.canvas.winfo_width())
+        vy1 = self.canvas.canvasy(0)
+        vy2 = self.canvas.canvasy(self.canvas.winfo_height())
+        return rx1 <= vx1 and vx2 <= rx2 and ry1 <= vy1 and vy2 <= ry2
+
+    def _refresh_rulers(self):
+        """Redraw the rulers only when the view has left their coverage"""
+        if not (self._show_rulers and self.base_scale_factor
+                and self.original_image):
+            return
+        if self._rulers_cover_view():
+            return
+        self.canvas.delete("ruler")
+        self.draw_rulers()
+
+    def _canvas_xview(self, *args):
+        """Scrollbar command: pan, then refresh rulers if needed"""
+        self.canvas.xview(*args)
+        self._refresh_rulers()
+
+    def _canvas_yview(self, *args):
+        """Scrollbar command: pan, then refresh rulers if needed"""
+        self.canvas.yview(*args)
+        self._refresh_rulers()
+
+    @staticmethod
+    def _nice_tick_spacing(target):
+        """Closed-form 1-2-5 tick spacing nearest to the target interval.
+
+        Equivalent to scanning a nice-numbers list but computed directly
+        from log10, so ruler redraws avoid the list walk entirely.
+        """
+        exp = math.floor(math.log10(target))
+        frac = target / 10 ** exp
+        if frac < 1.5:
+            nice = 1
+        elif frac < 3.5:
+            nice = 2
+        elif frac < 7.5:
+            nice = 5
+        else:
+            nice = 10
+        return nice * 10 ** exp
+
+    def _render_ruler_strip(self, axis, start, end, tick_spacing_px, scale):
+        """Render one ruler side (ticks + labels) into a PhotoImage strip.
+
+        Ticks and their labels are emitted in a single pass over the tick
+        indices with one ImageDraw handle and one shared font, so each
+        strip render walks the tick range exactly once.
+        """
+        if self._ruler_strip_font is None:
+            from PIL import ImageFont
+            self._ruler_strip_font = ImageFont.load_default()
+
+        ruler_size = self.settings['ruler_size']
+        ruler_color = self.settings['ruler_color']
+        length = max(1, int(end - start) + 1)
+
+        if axis == 'x':
+            strip = Image.new('RGBA', (length, ruler_size), (0, 0, 0, 0))
+        else:
+            strip = Image.new('RGBA', (ruler_size, length), (0, 0, 0, 0))
+        draw = ImageDraw.Draw(strip)
+        font = self._ruler_strip_font
+
+        # One multiply per major tick instead of a division; the scale
+        # factor is invariant across the strip
+        inv_scale = 1.0 / scale
+
+        first = max(0, int(start / tick_spacing_px))
+        last = int(end / tick_spacing_px)
+        for i in range(first, last + 1):
+            pos = i * tick_spacing_px - start
+            is_major = (i % 5 == 0)
+            tick_len = 15 if is_major else 8
+            if axis == 'x':
+                draw.line([(pos, 0), (pos, tick_len)], fill=ruler_color, width=1)
+                if is_major:
+                    real_distance = (i * tick_spacing_px) * inv_scale
+                    draw.text((pos + 2, tick_len + 1), f"{real_distance:.1f}",
+                              fill=ruler_color, font=font)
+            else:
+                draw.line([(0, pos), (tick_len, pos)], fill=ruler_color, width=1)
+                if is_major:
+                    real_distance = (i * tick_spacing_px) * inv_scale
+                    draw.text((tick_len + 2, pos + 1), f"{real_distance:.1f}",
+                              fill=ruler_color, font=font)
+
+        return ImageTk.PhotoImage(strip)
     
     def save_canvas_items(self):
         """Save positions of all calibration and measurement items"""
@@ -518,10 +824,15 @@ Instructions:
         if not saved_items:
             return
         
+        # Stored geometry is in source-image coordinates; convert to canvas
+        # coordinates once at draw time with a locally bound scale factor
+        s = self._canvas_scale()
+
         # Restore calibration line
         if len(saved_items['calibration_points']) == 2:
-            p1 = saved_items['calibration_points'][0]
-            p2 = saved_items['calibration_points'][1]
+            (ix1, iy1), (ix2, iy2) = saved_items['calibration_points']
+            p1 = (ix1 * s, iy1 * s)
+            p2 = (ix2 * s, iy2 * s)
             
             point_size = self.settings['point_size']
             # Draw points
@@ -543,34 +854,66 @@ Instructions:
         
         # Restore measurements
         self.measurements = []
+        # The conversion factor is constant across the loop, so compute it
+        # once instead of calling convert_unit per measurement; likewise
+        # the style defaults and point size
+        display_unit = self.display_unit_var.get()
+        unit_factor = self.convert_unit(1.0, "meters", display_unit)
+        settings = self.settings
+        def_line_color = settings['measurement_line_color']
+        def_point_color = settings['measurement_point_color']
+        def_line_width = settings['measurement_line_width']
+        def_text_color = settings['measurement_text_color']
+        point_size = settings['point_size']
+        show_labels = settings['show_measurement_labels']
+
+        # Pass 1: pure arithmetic and string building, no Tk calls.
+        # Endpoint dots don't need their item IDs back, so accumulate
+        # them as one Tcl script sent through the interpreter in a single
+        # call instead of one Python->Tcl round trip per oval
+        cv = str(self.canvas)
+        oval_cmds = []
+        prepared = []
         for m_data in saved_items['measurements']:
-            p1 = m_data['points'][0]
-            p2 = m_data['points'][1]
-            
+            (ix1, iy1), (ix2, iy2) = m_data['points']
+            x1, y1 = ix1 * s, iy1 * s
+            x2, y2 = ix2 * s, iy2 * s
+
             # Get custom colors if available, otherwise use defaults
-            line_color = m_data.get('line_color', self.settings['measurement_line_color'])
-            point_color = m_data.get('point_color', self.settings['measurement_point_color'])
-            line_width = m_data.get('line_width', self.settings['measurement_line_width'])
-            text_color = m_data.get('text_color', self.settings['measurement_text_color'])
-            
-            point_size = self.settings['point_size']
-            # Draw points
-            self.canvas.create_oval(p1[0]-point_size, p1[1]-point_size, 
-                                   p1[0]+point_size, p1[1]+point_size,
-                                   fill=point_color, outline=point_color, 
-                                   tags="measurement")
-            self.canvas.create_oval(p2[0]-point_size, p2[1]-point_size, 
-                                   p2[0]+point_size, p2[1]+point_size,
-                                   fill=point_color, outline=point_color, 
-                                   tags="measurement")
-            
-            # Draw line
-            line_id = self.canvas.create_line(p1[0], p1[1], p2[0], p2[1],
-                                             fill=line_color, width=line_width, 
-                                             tags="measurement")
-            
-            # Add measurement data
-            measurement_obj = {
+            line_color = m_data.get('line_color', def_line_color)
+            point_color = m_data.get('point_color', def_point_color)
+            line_width = m_data.get('line_width', def_line_width)
+            text_color = m_data.get('text_color', def_text_color)
+
+            for px, py in ((x1, y1), (x2, y2)):
+                oval_cmds.append(
+                    f"{cv} create oval {px-point_size} {py-point_size} "
+                    f"{px+point_size} {py+point_size} "
+                    f"-fill {point_color} -outline {point_color} -tags measurement"
+                )
+
+            label = None
+            if show_labels:
+                display_distance = m_data['distance'] * unit_factor
+                label = ((x1 + x2) / 2, (y1 + y2) / 2,
+                         f"{display_distance:.2f} {display_unit}")
+
+            prepared.append((m_data, x1, y1, x2, y2,
+                             line_color, point_color, line_width, text_color,
+                             label))
+
+        # Pass 2: a tight loop that only issues Tk calls with the values
+        # computed above
+        create_line = self.canvas.create_line
+        draw_label = self._draw_measurement_label
+        append = self.measurements.append
+        for (m_data, x1, y1, x2, y2,
+             line_color, point_color, line_width, text_color,
+             label) in prepared:
+            line_id = create_line(x1, y1, x2, y2,
+                                  fill=line_color, width=line_width,
+                                  tags="measurement")
+            append({
                 'points': m_data['points'].copy(),
                 'distance': m_data['distance'],
                 'line_id': line_id,
@@ -578,121 +921,121 @@ Instructions:
                 'point_color': point_color,
                 'line_width': line_width,
                 'text_color': text_color
-            }
-            self.measurements.append(measurement_obj)
-            
-            # Draw label
-            if self.settings['show_measurement_labels']:
-                mid_x = (p1[0] + p2[0]) / 2
-                mid_y = (p1[1] + p2[1]) / 2
-                display_distance = self.convert_unit(m_data['distance'], self.unit,
-                                                     self.display_unit_var.get())
-                text = f"{display_distance:.2f} {self.display_unit_var.get()}"
-                
-                if self.settings['label_background']:
-                    # Create background for text
-                    bbox_id = self.canvas.create_text(mid_x, mid_y - 10, text=text,
-                                           fill=text_color, 
-                                           font=(self.settings['measurement_text_font'], 
-                                                self.settings['measurement_text_size'], "bold"),
-                                           tags="measurement")
-                    bbox = self.canvas.bbox(bbox_id)
-                    if bbox:
-                        self.canvas.create_rectangle(bbox[0]-2, bbox[1]-2, bbox[2]+2, bbox[3]+2,
-                                                    fill=self.settings['label_bg_color'],
-                                                    outline="", tags="measurement")
-                        self.canvas.tag_raise(bbox_id)
-                else:
-                    self.canvas.create_text(mid_x, mid_y - 10, text=text,
-                                           fill=text_color, 
-                                           font=(self.settings['measurement_text_font'], 
-                                                self.settings['measurement_text_size'], "bold"),
-                                           tags="measurement")
-    
+            })
+            if label is not None:
+                draw_label(label[0], label[1], label[2], text_color)
+
+        self._invalidate_segments()
+        if oval_cmds:
+            self.canvas.tk.eval("\n".join(oval_cmds))
+
     def on_mouse_wheel(self, event):
         """Handle mouse wheel zoom"""
         if not self.original_image:
             return
-        
-        # Get mouse position before zoom
-        mouse_x = self.canvas.canvasx(event.x)
-        mouse_y = self.canvas.canvasy(event.y)
-        
-        # Determine zoom direction
+
+        # Determine zoom direction from the pending target so rapid wheel
+        # notches accumulate instead of each forcing a full redraw
+        target = self._pending_zoom if self._pending_zoom is not None else self.zoom_level
         if event.num == 5 or event.delta < 0:  # Zoom out
-            new_zoom = self.zoom_level - self.zoom_step
+            target -= self.zoom_step
         else:  # Zoom in (event.num == 4 or event.delta > 0)
-            new_zoom = self.zoom_level + self.zoom_step
-        
+            target += self.zoom_step
+
         # Clamp zoom level
-        new_zoom = max(self.min_zoom, min(self.max_zoom, new_zoom))
-        
-        if new_zoom != self.zoom_level:
-            # Calculate the zoom factor
-            zoom_factor = new_zoom / self.zoom_level
-            
-            # Update zoom level
-            old_zoom = self.zoom_level
-            self.zoom_level = new_zoom
-            
-            # Scale all canvas coordinates
-            self.scale_canvas_items(zoom_factor)
-            
-            # Redraw the image
-            self.display_image(keep_view_position=False)
-            
-            # Adjust scroll position to zoom towards mouse
-            # Get new mouse position in canvas coordinates
-            canvas_width = self.canvas.winfo_width()
-            canvas_height = self.canvas.winfo_height()
-            
-            # Calculate the new position after zoom
-            new_mouse_x = mouse_x * zoom_factor
-            new_mouse_y = mouse_y * zoom_factor
-            
-            # Scroll to keep the mouse position roughly in the same place
-            img_width = int(self.original_image.size[0] * self.base_scale * self.zoom_level)
-            img_height = int(self.original_image.size[1] * self.base_scale * self.zoom_level)
-            
-            if img_width > canvas_width:
-                x_pos = (new_mouse_x - event.x) / img_width
-                self.canvas.xview_moveto(max(0, min(1, x_pos)))
-            
-            if img_height > canvas_height:
-                y_pos = (new_mouse_y - event.y) / img_height
-                self.canvas.yview_moveto(max(0, min(1, y_pos)))
-            
-            # Force redraw rulers after scroll adjustment
-            if self.settings['show_rulers']:
-                self.canvas.after(10, self.draw_rulers)
+        target = max(self.min_zoom, min(self.max_zoom, target))
+
+        if target == self.zoom_level and self._pending_zoom is None:
+            return
+
+        # Coalesce: remember the target and the anchor point, then (re)arm a
+        # short timer so only the final scale of a wheel gesture is rendered
+        self._pending_zoom = target
+        self._pending_zoom_anchor = (event.x, event.y,
+                                     self.canvas.canvasx(event.x),
+                                     self.canvas.canvasy(event.y))
+        if self._zoom_after_id is not None:
+            self.canvas.after_cancel(self._zoom_after_id)
+        self._zoom_after_id = self.canvas.after(30, self._apply_pending_zoom)
+
+    def _apply_pending_zoom(self):
+        """Apply the coalesced wheel-zoom target in a single redraw"""
+        self._zoom_after_id = None
+        if self._pending_zoom is None:
+            return
+
+        new_zoom = self._pending_zoom
+        self._pending_zoom = None
+        event_x, event_y, mouse_x, mouse_y = self._pending_zoom_anchor
+
+        if new_zoom == self.zoom_level:
+            return
+
+        # Calculate the composed zoom factor for the whole gesture
+        zoom_factor = new_zoom / self.zoom_level
+        self.zoom_level = new_zoom
+
+        # Scale all canvas coordinates once with the composed factor
+        self._scale_zoom_items(zoom_factor)
+
+        # Redraw the image
+        self.display_image(keep_view_position=False, rebuild_overlays=False)
+
+        # Adjust scroll position to zoom towards mouse
+        canvas_width = self.canvas.winfo_width()
+        canvas_height = self.canvas.winfo_height()
+
+        # Calculate the new position after zoom
+        new_mouse_x = mouse_x * zoom_factor
+        new_mouse_y = mouse_y * zoom_factor
+
+        # Scroll to keep the mouse position roughly in the same place
+        img_width = int(self.original_image.size[0] * self.base_scale * self.zoom_level)
+        img_height = int(self.original_image.size[1] * self.base_scale * self.zoom_level)
+
+        if img_width > canvas_width:
+            x_pos = (new_mouse_x - event_x) / img_width
+            self.canvas.xview_moveto(max(0, min(1, x_pos)))
+
+        if img_height > canvas_height:
+            y_pos = (new_mouse_y - event_y) / img_height
+            self.canvas.yview_moveto(max(0, min(1, y_pos)))
+
+        # Force redraw rulers after scroll adjustment
+        if self.settings['show_rulers']:
+            self.canvas.after(10, self.draw_rulers)
     
+    def _scale_zoom_items(self, zoom_factor):
+        """Move existing canvas overlay items to match a zoom change.
+
+        Stored geometry lives in source-image coordinates, so only the
+        already-drawn canvas items need scaling; no stored point is touched.
+
+        Endpoint dots and label background rectangles are fixed-size
+        decorations: the tag-wide scale moves their centers to the right
+        place but also scales their extents, so each one is scaled back
+        around its own center to restore its original size.
+        """
+        canvas = self.canvas
+        canvas.scale("measurement", 0, 0, zoom_factor, zoom_factor)
+        canvas.scale("calibration", 0, 0, zoom_factor, zoom_factor)
+
+        inv = 1.0 / zoom_factor
+        coords = canvas.coords
+        item_type = canvas.type
+        scale = canvas.scale
+        for tag in ("measurement", "calibration"):
+            for item in canvas.find_withtag(tag):
+                kind = item_type(item)
+                if kind == 'oval' or kind == 'rectangle':
+                    x1, y1, x2, y2 = coords(item)
+                    scale(item, (x1 + x2) / 2, (y1 + y2) / 2, inv, inv)
+
     def on_canvas_configure(self, event):
         """Handle canvas resize/scroll events"""
-        # Redraw rulers when canvas is scrolled or resized
-        if self.settings['show_rulers'] and self.base_scale_factor and self.original_image:
-            self.canvas.delete("ruler")
-            self.draw_rulers()
-    
-    def scale_canvas_items(self, zoom_factor):
-        """Scale all stored coordinates by zoom factor"""
-        # Scale calibration points
-        self.calibration_points = [
-            (x * zoom_factor, y * zoom_factor) 
-            for x, y in self.calibration_points
-        ]
-        
-        # Scale current line points
-        self.current_line_points = [
-            (x * zoom_factor, y * zoom_factor)
-            for x, y in self.current_line_points
-        ]
-        
-        # Scale measurements
-        for m in self.measurements:
-            m['points'] = [
-                (x * zoom_factor, y * zoom_factor)
-                for x, y in m['points']
-            ]
+        # Redraw rulers only when the view has left the range the current
+        # strips cover; resizes within the padded range are free
+        self._refresh_rulers()
     
     def on_canvas_click(self, event):
         if not self.image:
@@ -705,11 +1048,14 @@ Instructions:
         
         if self.mode == "calibrate":
             # Apply snap if shift is pressed and we have a first point
-            if self.shift_pressed and len(self.calibration_points) == 1:
-                x, y = self.snap_to_axis(self.calibration_points[0], (x, y))
-            
-            self.calibration_points.append((x, y))
-            
+            if event.state & 0x0001 and len(self.calibration_points) == 1:
+                x, y = self.snap_to_axis(
+                    self._to_canvas(*self.calibration_points[0]), (x, y))
+
+            # Store in source-image coordinates so zooming never has to
+            # rescale the point; draw with the canvas coordinates
+            self.calibration_points.append(self._to_image(x, y))
+
             point_size = self.settings['point_size']
             # Draw point
             self.canvas.create_oval(x-point_size, y-point_size, x+point_size, y+point_size, 
@@ -719,11 +1065,12 @@ Instructions:
             
             if len(self.calibration_points) == 2:
                 # Draw calibration line
+                c1 = self._to_canvas(*self.calibration_points[0])
+                c2 = self._to_canvas(*self.calibration_points[1])
                 self.canvas.create_line(
-                    self.calibration_points[0][0], self.calibration_points[0][1],
-                    self.calibration_points[1][0], self.calibration_points[1][1],
-                    fill=self.settings['calibration_line_color'], 
-                    width=self.settings['calibration_line_width'], 
+                    c1[0], c1[1], c2[0], c2[1],
+                    fill=self.settings['calibration_line_color'],
+                    width=self.settings['calibration_line_width'],
                     tags="calibration"
                 )
                 
@@ -732,25 +1079,28 @@ Instructions:
         
         elif self.mode == "measure":
             # Apply snap if shift is pressed and we have a first point
-            if self.shift_pressed and len(self.current_line_points) == 1:
-                x, y = self.snap_to_axis(self.current_line_points[0], (x, y))
-            
-            self.current_line_points.append((x, y))
-            
+            if event.state & 0x0001 and len(self.current_line_points) == 1:
+                x, y = self.snap_to_axis(
+                    self._to_canvas(*self.current_line_points[0]), (x, y))
+
+            self.current_line_points.append(self._to_image(x, y))
+
             point_size = self.settings['point_size']
-            # Draw point
-            self.canvas.create_oval(x-point_size, y-point_size, x+point_size, y+point_size, 
+            # Draw point, remembering the item id for incremental undo
+            point_id = self.canvas.create_oval(x-point_size, y-point_size, x+point_size, y+point_size, 
                                    fill=self.settings['measurement_point_color'], 
                                    outline=self.settings['measurement_point_color'],
                                    tags="measurement")
+            self._current_point_ids.append(point_id)
             
             if len(self.current_line_points) == 2:
                 # Draw measurement line
+                c1 = self._to_canvas(*self.current_line_points[0])
+                c2 = self._to_canvas(*self.current_line_points[1])
                 line_id = self.canvas.create_line(
-                    self.current_line_points[0][0], self.current_line_points[0][1],
-                    self.current_line_points[1][0], self.current_line_points[1][1],
-                    fill=self.settings['measurement_line_color'], 
-                    width=self.settings['measurement_line_width'], 
+                    c1[0], c1[1], c2[0], c2[1],
+                    fill=self.settings['measurement_line_color'],
+                    width=self.settings['measurement_line_width'],
                     tags="measurement"
                 )
                 
@@ -760,101 +1110,166 @@ Instructions:
                     self.current_line_points[1]
                 )
                 
+                # Every item drawn for this measurement, so undo/delete
+                # can remove just these instead of rebuilding the canvas
+                canvas_ids = self._current_point_ids + [line_id]
+
+                # Display measurement on canvas
+                if self.settings['show_measurement_labels']:
+                    mid_x = (c1[0] + c2[0]) / 2
+                    mid_y = (c1[1] + c2[1]) / 2
+
+                    display_distance = self.convert_unit(distance, "meters",
+                                                         self.display_unit_var.get())
+                    text = f"{display_distance:.2f} {self.display_unit_var.get()}"
+                    canvas_ids += self._draw_measurement_label(
+                        mid_x, mid_y, text,
+                        self.settings['measurement_text_color'])
+
                 # Store measurement with custom color options
                 self.measurements.append({
                     "points": self.current_line_points.copy(),
                     "distance": distance,
                     "line_id": line_id,
+                    "canvas_ids": canvas_ids,
                     "line_color": self.settings['measurement_line_color'],
                     "point_color": self.settings['measurement_point_color'],
                     "line_width": self.settings['measurement_line_width'],
                     "text_color": self.settings['measurement_text_color']
                 })
-                
-                # Display measurement on canvas
-                if self.settings['show_measurement_labels']:
-                    mid_x = (self.current_line_points[0][0] + self.current_line_points[1][0]) / 2
-                    mid_y = (self.current_line_points[0][1] + self.current_line_points[1][1]) / 2
-                    
-                    display_distance = self.convert_unit(distance, self.unit, 
-                                                         self.display_unit_var.get())
-                    text = f"{display_distance:.2f} {self.display_unit_var.get()}"
-                    
-                    if self.settings['label_background']:
-                        text_id = self.canvas.create_text(mid_x, mid_y - 10, text=text, 
-                                           fill=self.settings['measurement_text_color'], 
-                                           font=(self.settings['measurement_text_font'], 
-                                                self.settings['measurement_text_size'], "bold"),
-                                           tags="measurement")
-                        bbox = self.canvas.bbox(text_id)
-                        if bbox:
-                            self.canvas.create_rectangle(bbox[0]-2, bbox[1]-2, bbox[2]+2, bbox[3]+2,
-                                                        fill=self.settings['label_bg_color'],
-                                                        outline="", tags="measurement")
-                            self.canvas.tag_raise(text_id)
-                    else:
-                        self.canvas.create_text(mid_x, mid_y - 10, text=text, 
-                                           fill=self.settings['measurement_text_color'], 
-                                           font=(self.settings['measurement_text_font'], 
-                                                self.settings['measurement_text_size'], "bold"),
-                                           tags="measurement")
-                
-                # Update measurements display
-                self.update_measurements_display()
+                self._invalidate_segments()
+
+                # Update measurements display (coalesced)
+                self._schedule_display_update()
                 
                 # Reset for next measurement
                 self.current_line_points = []
+                self._current_point_ids = []
     
+    def _get_label_font(self):
+        """Cached Tk font object for measurement labels"""
+        if self._label_font is None:
+            self._label_font = tkfont.Font(
+                family=self.settings['measurement_text_font'],
+                size=self.settings['measurement_text_size'],
+                weight='bold'
+            )
+        return self._label_font
+
+    def _get_small_font(self):
+        """Cached Tk font for the snap indicator and ruler readout"""
+        if self._small_font is None:
+            self._small_font = tkfont.Font(family='Arial', size=8,
+                                           weight='bold')
+        return self._small_font
+
+    def _draw_measurement_label(self, mid_x, mid_y, text, text_color):
+        """Draw a measurement label (and optional background) on the canvas.
+
+        The background rectangle is sized from cached font metrics and
+        created before the text, so no canvas.bbox round trip or tag_raise
+        is needed per label.
+        """
+        font = self._get_label_font()
+        ids = []
+        if self.settings['label_background']:
+            half_w = font.measure(text) / 2
+            half_h = font.metrics('linespace') / 2
+            ids.append(self.canvas.create_rectangle(
+                mid_x - half_w - 2, mid_y - 10 - half_h - 2,
+                mid_x + half_w + 2, mid_y - 10 + half_h + 2,
+                fill=self.settings['label_bg_color'],
+                outline="", tags="measurement"
+            ))
+        ids.append(self.canvas.create_text(mid_x, mid_y - 10, text=text,
+                                           fill=text_color, font=font,
+                                           tags="measurement"))
+        return ids
+
+    def _schedule_display_update(self):
+        """Coalesce measurements-panel refreshes into one idle callback"""
+        if self._display_update_pending:
+            return
+        self._display_update_pending = True
+        self.canvas.after_idle(self._flush_display_update)
+
+    def _flush_display_update(self):
+        self._display_update_pending = False
+        self.update_measurements_display()
+
     def on_mouse_move(self, event):
+        """Coalesce motion events to ~60 Hz; Tk delivers them faster than
+        the preview/crosshair items are worth redrawing"""
+        self._last_move_event = event
+        if self._move_pending is None:
+            self._move_pending = self.canvas.after(16, self._do_mouse_move)
+
+    def _do_mouse_move(self):
+        """Process the most recent motion event"""
+        self._move_pending = None
+        event = self._last_move_event
+        if event is None:
+            return
+
+        # One canvasx/canvasy round trip per event, shared by every
+        # consumer below
+        cx = self.canvas.canvasx(event.x)
+        cy = self.canvas.canvasy(event.y)
+
         # Update crosshair
-        if self.settings['show_crosshair'] and self.crosshair_visible:
-            self.draw_crosshair(event)
+        if self._show_crosshair and self.crosshair_visible:
+            self.draw_crosshair(event, cx, cy)
         
         # Update ruler coordinates display
-        if self.settings['show_rulers']:
-            self.update_ruler_coordinates(event)
+        if self._show_rulers:
+            self.update_ruler_coordinates(event, cx, cy)
         
         # Show preview line while drawing
         if self.mode == "calibrate" and len(self.calibration_points) == 1:
             self.canvas.delete("preview")
             self.canvas.delete("snap_indicator")
-            x = self.canvas.canvasx(event.x)
-            y = self.canvas.canvasy(event.y)
-            
+            x, y = cx, cy
+            p0 = self._to_canvas(*self.calibration_points[0])
+
             # Apply snap if shift is pressed
-            if self.shift_pressed:
-                x, y = self.snap_to_axis(self.calibration_points[0], (x, y))
+            if event.state & 0x0001:
+                x, y = self.snap_to_axis(p0, (x, y))
                 # Draw snap indicator
                 self.draw_snap_indicator((x, y))
-            
+
             self.canvas.create_line(
-                self.calibration_points[0][0], self.calibration_points[0][1],
-                x, y, fill=self.settings['calibration_line_color'], 
+                p0[0], p0[1],
+                x, y, fill=self._calib_line_color,
                 width=1, dash=(4, 4), tags="preview"
             )
-        
+
         elif self.mode == "measure" and len(self.current_line_points) == 1:
             self.canvas.delete("preview")
             self.canvas.delete("snap_indicator")
-            x = self.canvas.canvasx(event.x)
-            y = self.canvas.canvasy(event.y)
-            
+            x, y = cx, cy
+            p0 = self._to_canvas(*self.current_line_points[0])
+
             # Apply snap if shift is pressed
-            if self.shift_pressed:
-                x, y = self.snap_to_axis(self.current_line_points[0], (x, y))
+            if event.state & 0x0001:
+                x, y = self.snap_to_axis(p0, (x, y))
                 # Draw snap indicator
                 self.draw_snap_indicator((x, y))
-            
+
             self.canvas.create_line(
-                self.current_line_points[0][0], self.current_line_points[0][1],
-                x, y, fill=self.settings['measurement_line_color'], 
+                p0[0], p0[1],
+                x, y, fill=self._measure_line_color,
                 width=1, dash=(4, 4), tags="preview"
             )
     
     def on_mouse_leave(self, event):
         """Hide crosshair when mouse leaves canvas"""
+        if self._move_pending is not None:
+            self.canvas.after_cancel(self._move_pending)
+            self._move_pending = None
+        self._last_move_event = None
+        self._last_ruler_ixy = None
         self.crosshair_visible = False
-        self.canvas.delete("crosshair")
+        self._hide_crosshair()
         self.canvas.delete("ruler_coords")
         self.canvas.delete("snap_indicator")
     
@@ -862,30 +1277,17 @@ Instructions:
         """Show crosshair when mouse enters canvas"""
         self.crosshair_visible = True
     
-    def on_shift_press(self, event):
-        """Handle Shift key press"""
-        self.shift_pressed = True
-    
-    def on_shift_release(self, event):
-        """Handle Shift key release"""
-        self.shift_pressed = False
-        self.canvas.delete("snap_indicator")
-    
     def snap_to_axis(self, start_point, end_point):
         """Snap end point to horizontal or vertical axis relative to start point"""
         x1, y1 = start_point
         x2, y2 = end_point
-        
-        dx = abs(x2 - x1)
-        dy = abs(y2 - y1)
-        
-        # Snap to the axis with greater movement
-        if dx > dy:
-            # Snap to horizontal (keep x, set y to start y)
-            return (x2, y1)
-        else:
-            # Snap to vertical (keep y, set x to start x)
-            return (x1, y2)
+
+        dx = x2 - x1
+        dy = y2 - y1
+
+        # Snap to the axis with greater movement; comparing squared deltas
+        # avoids the two abs() calls
+        return (x2, y1) if dx * dx > dy * dy else (x1, y2)
     
     def draw_snap_indicator(self, point):
         """Draw a visual indicator that snapping is active"""
@@ -905,56 +1307,70 @@ Instructions:
             x, y - 15,
             text="SNAP",
             fill="#FF00FF",
-            font=("Arial", 8, "bold"),
+            font=self._get_small_font(),
             tags="snap_indicator"
         )
     
-    def draw_crosshair(self, event):
-        """Draw infinite crosshair lines"""
-        self.canvas.delete("crosshair")
-        
-        x = self.canvas.canvasx(event.x)
-        y = self.canvas.canvasy(event.y)
-        
-        # Get scroll region (canvas bounds)
-        scroll_region = self.canvas.cget("scrollregion")
-        if scroll_region:
-            x1, y1, x2, y2 = map(float, scroll_region.split())
-        else:
-            x1, y1 = 0, 0
-            x2, y2 = self.canvas.winfo_width(), self.canvas.winfo_height()
-        
-        # Draw horizontal line (infinite width)
-        self.canvas.create_line(
-            x1, y, x2, y,
-            fill=self.settings['crosshair_color'],
-            width=self.settings['crosshair_width'],
-            tags="crosshair"
+    def _ensure_crosshair_items(self):
+        """Create the two reusable crosshair lines if they don't exist yet"""
+        if self._crosshair_h is not None:
+            return
+        color = self.settings['crosshair_color']
+        width = self.settings['crosshair_width']
+        self._crosshair_h = self.canvas.create_line(
+            0, 0, 0, 0, fill=color, width=width,
+            state='hidden', tags="crosshair"
         )
-        
-        # Draw vertical line (infinite height)
-        self.canvas.create_line(
-            x, y1, x, y2,
-            fill=self.settings['crosshair_color'],
-            width=self.settings['crosshair_width'],
-            tags="crosshair"
+        self._crosshair_v = self.canvas.create_line(
+            0, 0, 0, 0, fill=color, width=width,
+            state='hidden', tags="crosshair"
         )
-        
         # Keep crosshair on top of image but below other elements
         self.canvas.tag_lower("crosshair")
         if self.canvas_image:
             self.canvas.tag_raise("crosshair", self.canvas_image)
+
+    def _hide_crosshair(self):
+        """Hide the crosshair lines without destroying the items"""
+        if self._crosshair_h is not None:
+            self.canvas.itemconfig(self._crosshair_h, state='hidden')
+            self.canvas.itemconfig(self._crosshair_v, state='hidden')
+
+    def draw_crosshair(self, event, x=None, y=None):
+        """Move the reusable crosshair lines to the pointer position.
+
+        The caller may pass pre-computed canvas coordinates to avoid
+        redundant canvasx/canvasy round trips.
+        """
+        if x is None:
+            x = self.canvas.canvasx(event.x)
+            y = self.canvas.canvasy(event.y)
+
+        # Scroll region (canvas bounds), parsed once when it is set
+        # instead of a cget + string parse per pointer frame
+        if self._scroll_region:
+            x1, y1, x2, y2 = self._scroll_region
+        else:
+            x1, y1 = 0, 0
+            x2, y2 = self.canvas.winfo_width(), self.canvas.winfo_height()
+
+        # Update the existing items in place: no create/delete churn on
+        # every pointer motion event
+        self._ensure_crosshair_items()
+        self.canvas.coords(self._crosshair_h, x1, y, x2, y)
+        self.canvas.coords(self._crosshair_v, x, y1, x, y2)
+        self.canvas.itemconfig(self._crosshair_h, state='normal')
+        self.canvas.itemconfig(self._crosshair_v, state='normal')
     
-    def update_ruler_coordinates(self, event):
+    def update_ruler_coordinates(self, event, x=None, y=None):
         """Update coordinate display on rulers"""
-        if not self.base_scale_factor or not self.settings['show_rulers']:
+        if not self.base_scale_factor or not self._show_rulers:
             return
-        
-        self.canvas.delete("ruler_coords")
-        
-        x = self.canvas.canvasx(event.x)
-        y = self.canvas.canvasy(event.y)
-        
+
+        if x is None:
+            x = self.canvas.canvasx(event.x)
+            y = self.canvas.canvasy(event.y)
+
         # Calculate real-world coordinates if calibrated
         if self.base_scale_factor:
             # Calculate current scale factor based on zoom
@@ -962,20 +1378,27 @@ Instructions:
             # Distance from origin (0,0) in real units
             real_x = x / current_scale_factor
             real_y = y / current_scale_factor
-            
+
+            # Skip the redraw entirely when the readout would show the
+            # same two-decimal values as the previous frame
+            ixy = (int(real_x * 100), int(real_y * 100))
+            if ixy == self._last_ruler_ixy:
+                return
+            self._last_ruler_ixy = ixy
+
+            self.canvas.delete("ruler_coords")
+
             # Display coordinates
-            coord_text_x = f"{real_x:.2f}"
-            coord_text_y = f"{real_y:.2f}"
-            
-            # Show on rulers (in window coordinates)
-            ruler_size = self.settings['ruler_size']
+            fmt = self._fmt2
+            coord_text_x = fmt(real_x)
+            coord_text_y = fmt(real_y)
             
             # X coordinate on top ruler
             self.canvas.create_text(
                 event.x, 10,
                 text=coord_text_x,
-                fill=self.settings['ruler_color'],
-                font=("Arial", 8, "bold"),
+                fill=self._ruler_color,
+                font=self._get_small_font(),
                 tags="ruler_coords"
             )
             
@@ -983,42 +1406,149 @@ Instructions:
             self.canvas.create_text(
                 10, event.y,
                 text=coord_text_y,
-                fill=self.settings['ruler_color'],
-                font=("Arial", 8, "bold"),
+                fill=self._ruler_color,
+                font=self._get_small_font(),
                 tags="ruler_coords"
             )
     
+    def _canvas_scale(self):
+        """Canvas pixels per source-image pixel at the current zoom"""
+        return self.base_scale * self.zoom_level
+
+    def _to_canvas(self, ix, iy):
+        """Convert source-image coordinates to canvas coordinates"""
+        s = self.base_scale * self.zoom_level
+        return ix * s, iy * s
+
+    def _to_image(self, cx, cy):
+        """Convert canvas coordinates to source-image coordinates"""
+        s = self.base_scale * self.zoom_level
+        return cx / s, cy / s
+
+    def _invalidate_segments(self):
+        """Mark the flat sidecars as stale after measurements change"""
+        self._segments_dirty = True
+
+    def _rebuild_sidecars(self):
+        """Rebuild the flat geometry/distance sidecars from the dicts.
+
+        The per-measurement dicts stay the source of truth (they also
+        carry the style overrides), but the numeric hot paths — hit
+        testing, distance sums, batch recomputes — iterate these compact
+        parallel lists instead of chasing through dicts.
+        """
+        self._segments = [(m['points'][0][0], m['points'][0][1],
+                           m['points'][1][0], m['points'][1][1])
+                          for m in self.measurements]
+        self._distances = [m['distance'] for m in self.measurements]
+        self._segments_dirty = False
+
+    def _segment_list(self):
+        """Flat (x1, y1, x2, y2) endpoint tuples for all measurements"""
+        if self._segments_dirty:
+            self._rebuild_sidecars()
+        return self._segments
+
+    def _distance_list(self):
+        """Flat stored distances (meters), parallel to _segment_list"""
+        if self._segments_dirty:
+            self._rebuild_sidecars()
+        return self._distances
+
+    def _recompute_distances(self):
+        """Recompute every stored distance from its endpoints in one pass.
+
+        Runs over the flat segment sidecar with the scale factor and unit
+        conversion hoisted out of the loop, so recalibrating with many
+        measurements on screen is a single tight arithmetic sweep.
+        """
+        if not self.measurements or not self.image_scale_factor:
+            return
+        factor = _M_PER_UNIT[self.unit_id] / self.image_scale_factor
+        sqrt = math.sqrt
+        for m, (x1, y1, x2, y2) in zip(self.measurements,
+                                       self._segment_list()):
+            dx = x2 - x1
+            dy = y2 - y1
+            m['distance'] = sqrt(dx * dx + dy * dy) * factor
+        # Stored distances changed; the distance sidecar is stale
+        self._segments_dirty = True
+
+    def _find_measurement_at(self, px, py, threshold):
+        """Return the index of the measurement nearest (px, py), or None.
+
+        Scans the flat segment list with the point-to-segment projection
+        inlined, so the hot loop does plain arithmetic with no method
+        dispatch per segment, and picks the closest hit within threshold
+        rather than the first. All comparisons happen in squared space,
+        so the loop never calls math.sqrt.
+        """
+        best_idx = None
+        best_dist_sq = threshold * threshold
+        for i, (x1, y1, x2, y2) in enumerate(self._segment_list()):
+            vx = x2 - x1
+            vy = y2 - y1
+            length_sq = vx * vx + vy * vy
+            if length_sq == 0:
+                dx = px - x1
+                dy = py - y1
+            else:
+                t = ((px - x1) * vx + (py - y1) * vy) / length_sq
+                t = 0.0 if t < 0.0 else (1.0 if t > 1.0 else t)
+                dx = px - (x1 + t * vx)
+                dy = py - (y1 + t * vy)
+            dist_sq = dx * dx + dy * dy
+            if dist_sq < best_dist_sq:
+                best_dist_sq = dist_sq
+                best_idx = i
+        return best_idx
+
     def on_right_click(self, event):
         """Handle right-click to select and customize measurements"""
-        x = self.canvas.canvasx(event.x)
-        y = self.canvas.canvasy(event.y)
-        
+        # No image means no scale factor (and nothing to hit) yet
+        if not self.image:
+            return
+
+        x, y = self._to_image(self.canvas.canvasx(event.x),
+                              self.canvas.canvasy(event.y))
+
+        # Segments are stored in image coordinates, so scale the 10-pixel
+        # on-screen threshold into image space
+        threshold = 10 / self._canvas_scale()
+
         # Find which measurement was clicked
-        for i, measurement in enumerate(self.measurements):
-            p1, p2 = measurement['points']
-            # Check if click is near the line
-            dist_to_line = self.point_to_line_distance((x, y), p1, p2)
-            if dist_to_line < 10:  # 10 pixels threshold
-                self.selected_measurement_index = i
-                self.show_measurement_context_menu(event, i)
-                break
+        idx = self._find_measurement_at(x, y, threshold)
+        if idx is not None:
+            self.selected_measurement_index = idx
+            self.show_measurement_context_menu(event, idx)
     
-    def point_to_line_distance(self, point, line_start, line_end):
-        """Calculate perpendicular distance from point to line segment"""
+    def point_to_line_distance_sq(self, point, line_start, line_end):
+        """Squared distance from point to line segment.
+
+        Works entirely in squared space so threshold tests can compare
+        against a squared threshold without ever calling math.sqrt.
+        """
         px, py = point
         x1, y1 = line_start
         x2, y2 = line_end
-        
-        line_length = math.sqrt((x2 - x1)**2 + (y2 - y1)**2)
-        if line_length == 0:
-            return math.sqrt((px - x1)**2 + (py - y1)**2)
-        
-        # Calculate perpendicular distance
-        t = max(0, min(1, ((px - x1) * (x2 - x1) + (py - y1) * (y2 - y1)) / (line_length ** 2)))
-        projection_x = x1 + t * (x2 - x1)
-        projection_y = y1 + t * (y2 - y1)
-        
-        return math.sqrt((px - projection_x)**2 + (py - projection_y)**2)
+
+        dx = x2 - x1
+        dy = y2 - y1
+        line_length_sq = dx * dx + dy * dy
+        if line_length_sq == 0:
+            ex = px - x1
+            ey = py - y1
+            return ex * ex + ey * ey
+
+        # Clamp the projection onto the segment
+        t = max(0, min(1, ((px - x1) * dx + (py - y1) * dy) / line_length_sq))
+        ex = px - (x1 + t * dx)
+        ey = py - (y1 + t * dy)
+        return ex * ex + ey * ey
+
+    def point_to_line_distance(self, point, line_start, line_end):
+        """Calculate perpendicular distance from point to line segment"""
+        return math.sqrt(self.point_to_line_distance_sq(point, line_start, line_end))
     
     def show_measurement_context_menu(self, event, index):
         """Show context menu for measurement customization"""
@@ -1035,24 +1565,36 @@ Instructions:
             if reference_distance <= 0:
                 raise ValueError("Distance must be positive")
             
-            # Calculate pixel distance at current zoom level
-            pixel_distance = math.sqrt(
-                (self.calibration_points[1][0] - self.calibration_points[0][0])**2 +
-                (self.calibration_points[1][1] - self.calibration_points[0][1])**2
+            # Calibration points are stored in source-image coordinates, so
+            # this distance (and the scale factor derived from it) is
+            # independent of the zoom level at calibration time
+            pixel_distance = math.hypot(
+                self.calibration_points[1][0] - self.calibration_points[0][0],
+                self.calibration_points[1][1] - self.calibration_points[0][1]
             )
-            
+
             # Store the zoom level when calibration was done
             self.calibration_zoom_level = self.zoom_level
-            
-            # Calculate scale factor at current zoom (pixels per unit)
-            self.scale_factor = pixel_distance / reference_distance
-            
-            # Calculate base scale factor (normalized to zoom level 1.0)
-            # This is independent of zoom and represents the true pixel-to-unit ratio
-            self.base_scale_factor = self.scale_factor / self.zoom_level
+
+            # Source-image pixels per unit: the canonical scale
+            self.image_scale_factor = pixel_distance / reference_distance
+
+            # Canvas pixels per unit at zoom 1.0 (used by the rulers)
+            self.base_scale_factor = self.image_scale_factor * self.base_scale
+
+            # Canvas pixels per unit at the current zoom
+            self.scale_factor = self.base_scale_factor * self.zoom_level
             
             self.unit = self.unit_var.get()
-            
+            self.unit_id = _UNIT_IDX.get(self.unit, 0)
+
+            # Recalibrating changes the scale every stored distance was
+            # derived from, so refresh them all in one batch sweep
+            if self.measurements:
+                self._recompute_distances()
+                self.display_image()
+                self.update_measurements_display()
+
             # Update status
             self.calib_status.config(
                 text=f"Calibrated: {reference_distance} {self.unit}",
@@ -1074,85 +1616,72 @@ Instructions:
             self.reset_calibration()
     
     def calculate_distance(self, point1, point2):
-        """Calculate real-world distance between two points"""
-        if self.base_scale_factor is None:
+        """Real-world distance between two image-space points, in meters.
+
+        Distances are stored canonically in meters regardless of the
+        calibration unit, so display/export conversion is always a single
+        multiply and changing units never rewrites stored measurements.
+        """
+        if self.image_scale_factor is None:
             return 0
-        
-        # Calculate pixel distance at current zoom level
-        pixel_distance = math.sqrt(
-            (point2[0] - point1[0])**2 + (point2[1] - point1[1])**2
-        )
-        
-        # Use base_scale_factor and adjust for current zoom
-        # Since coordinates are scaled by zoom, we need to account for that
-        current_scale_factor = self.base_scale_factor * self.zoom_level
-        
-        real_distance = pixel_distance / current_scale_factor
-        return real_distance
+
+        # Points are in source-image pixels, so no zoom adjustment is
+        # needed and the result is stable across zoom round-trips
+        pixel_distance = math.hypot(point2[0] - point1[0],
+                                    point2[1] - point1[1])
+
+        return (pixel_distance / self.image_scale_factor) * _M_PER_UNIT[self.unit_id]
     
     def convert_unit(self, value, from_unit, to_unit):
-        """Convert between different units"""
-        # Convert to meters first
-        to_meters = {
-            "meters": 1.0,
-            "centimeters": 0.01,
-            "feet": 0.3048,
-            "inches": 0.0254
-        }
-        
-        from_meters = {
-            "meters": 1.0,
-            "centimeters": 100.0,
-            "feet": 3.28084,
-            "inches": 39.3701
-        }
-        
-        value_in_meters = value * to_meters.get(from_unit, 1.0)
-        converted_value = value_in_meters * from_meters.get(to_unit, 1.0)
-        
-        return converted_value
+        """Convert between different units with a single factor lookup"""
+        # Unknown units fall back to meters, matching the old .get default
+        return value * _CONV[_UNIT_IDX.get(from_unit, 0)][_UNIT_IDX.get(to_unit, 0)]
+
+    def convert_units_batch(self, values, from_unit, to_unit):
+        """Convert a whole sequence of values with one factor lookup"""
+        factor = _CONV[_UNIT_IDX.get(from_unit, 0)][_UNIT_IDX.get(to_unit, 0)]
+        return [v * factor for v in values]
     
+    def on_display_unit_change(self, event=None):
+        """Resolve the picked display unit to its integer id once"""
+        self.display_unit_id = _UNIT_IDX.get(self.display_unit_var.get(), 0)
+        self.update_measurements_display()
+
     def update_measurements_display(self, event=None):
         """Update the measurements text display"""
         self.measurements_text.delete(1.0, tk.END)
-        
+
         if not self.measurements:
             self.measurements_text.insert(tk.END, "No measurements yet.\n")
             return
-        
+
         display_unit = self.display_unit_var.get()
-        
-        self.measurements_text.insert(tk.END, f"All measurements in {display_unit}:\n")
-        self.measurements_text.insert(tk.END, "-" * 40 + "\n")
-        
-        for i, measurement in enumerate(self.measurements, 1):
-            distance = self.convert_unit(measurement["distance"], self.unit, display_unit)
-            self.measurements_text.insert(tk.END, f"{i}. {distance:.3f} {display_unit}\n")
-        
-        # Calculate total
-        total = sum(m["distance"] for m in self.measurements)
-        total_converted = self.convert_unit(total, self.unit, display_unit)
-        
-        self.measurements_text.insert(tk.END, "-" * 40 + "\n")
-        self.measurements_text.insert(tk.END, f"Total: {total_converted:.3f} {display_unit}\n")
-        
-        # Redraw measurement labels with new unit
-        self.canvas.delete("measurement_label")
-        for measurement in self.measurements:
-            mid_x = (measurement["points"][0][0] + measurement["points"][1][0]) / 2
-            mid_y = (measurement["points"][0][1] + measurement["points"][1][1]) / 2
-            
-            display_distance = self.convert_unit(measurement["distance"], self.unit, display_unit)
-            text = f"{display_distance:.2f} {display_unit}"
-            
-            # Remove old text tags and add new ones
-            # Note: this is a simplified approach
+        # Direct integer index into the factor matrix: no string hashing
+        # per refresh, and the id is maintained by the combobox handler
+        factor = _CONV[0][self.display_unit_id]
+        separator = "-" * 40
+
+        # Build the whole report as one string and hand it to Tk in a
+        # single insert instead of one boundary crossing per line
+        distances = self._distance_list()
+        lines = [f"All measurements in {display_unit}:", separator]
+        lines.extend(
+            f"{i}. {d * factor:.3f} {display_unit}"
+            for i, d in enumerate(distances, 1)
+        )
+
+        total = sum(distances)
+        lines.append(separator)
+        lines.append(f"Total: {total * factor:.3f} {display_unit}")
+
+        self.measurements_text.insert(tk.END, "\n".join(lines) + "\n")
     
     def clear_measurements(self):
         """Clear all measurements but keep calibration"""
         if messagebox.askyesno("Clear Measurements", 
                               "Are you sure you want to clear all measurements?"):
             self.measurements = []
+            self._invalidate_segments()
             self.current_line_points = []
             self.canvas.delete("measurement")
             self.canvas.delete("preview")
@@ -1162,10 +1691,12 @@ Instructions:
         """Reset calibration and all measurements"""
         self.scale_factor = None
         self.base_scale_factor = None
+        self.image_scale_factor = None
         self.calibration_zoom_level = 1.0
         self.calibration_points = []
         self.current_line_points = []
         self.measurements = []
+        self._invalidate_segments()
         self.mode = "calibrate"
         
         self.calib_status.config(text="Not calibrated", foreground="red")
@@ -1183,12 +1714,6 @@ Instructions:
     
     def setup_keyboard_shortcuts(self):
         """Setup keyboard shortcuts"""
-        # Shift key for line snapping
-        self.root.bind('<KeyPress-Shift_L>', self.on_shift_press)
-        self.root.bind('<KeyPress-Shift_R>', self.on_shift_press)
-        self.root.bind('<KeyRelease-Shift_L>', self.on_shift_release)
-        self.root.bind('<KeyRelease-Shift_R>', self.on_shift_release)
-        
         # File operations
         self.root.bind('<Control-o>', lambda e: self.load_image())
         self.root.bind('<Control-O>', lambda e: self.load_image())
@@ -1225,8 +1750,8 @@ Instructions:
         self.root.bind('<Control-comma>', lambda e: self.open_settings_dialog())
         
         # Quit
-        self.root.bind('<Control-q>', lambda e: self.root.quit())
-        self.root.bind('<Control-Q>', lambda e: self.root.quit())
+        self.root.bind('<Control-q>', lambda e: self._on_close())
+        self.root.bind('<Control-Q>', lambda e: self._on_close())
     
     def zoom_in_keyboard(self):
         """Zoom in using keyboard"""
@@ -1239,8 +1764,8 @@ Instructions:
         if new_zoom != self.zoom_level:
             zoom_factor = new_zoom / self.zoom_level
             self.zoom_level = new_zoom
-            self.scale_canvas_items(zoom_factor)
-            self.display_image(keep_view_position=False)
+            self._scale_zoom_items(zoom_factor)
+            self.display_image(keep_view_position=False, rebuild_overlays=False)
             # Force redraw rulers
             if self.settings['show_rulers']:
                 self.canvas.after(10, self.draw_rulers)
@@ -1256,8 +1781,8 @@ Instructions:
         if new_zoom != self.zoom_level:
             zoom_factor = new_zoom / self.zoom_level
             self.zoom_level = new_zoom
-            self.scale_canvas_items(zoom_factor)
-            self.display_image(keep_view_position=False)
+            self._scale_zoom_items(zoom_factor)
+            self.display_image(keep_view_position=False, rebuild_overlays=False)
             # Force redraw rulers
             if self.settings['show_rulers']:
                 self.canvas.after(10, self.draw_rulers)
@@ -1270,8 +1795,8 @@ Instructions:
         if self.zoom_level != 1.0:
             zoom_factor = 1.0 / self.zoom_level
             self.zoom_level = 1.0
-            self.scale_canvas_items(zoom_factor)
-            self.display_image(keep_view_position=False)
+            self._scale_zoom_items(zoom_factor)
+            self.display_image(keep_view_position=False, rebuild_overlays=False)
             # Force redraw rulers
             if self.settings['show_rulers']:
                 self.canvas.after(10, self.draw_rulers)
@@ -1279,9 +1804,15 @@ Instructions:
     def undo_last_measurement(self):
         """Remove the last measurement"""
         if self.measurements:
-            self.measurements.pop()
-            # Redraw canvas
-            if self.original_image:
+            removed = self.measurements.pop()
+            self._invalidate_segments()
+            # Delete just this measurement's items when we know them;
+            # measurements restored via the batched zoom path don't carry
+            # ids, so those fall back to a full redraw
+            canvas_ids = removed.get('canvas_ids')
+            if canvas_ids:
+                self.canvas.delete(*canvas_ids)
+            elif self.original_image:
                 self.display_image(keep_view_position=False)
             self.update_measurements_display()
     
@@ -1296,9 +1827,10 @@ Instructions:
             self.current_line_points = []
             self.canvas.delete("preview")
             self.canvas.delete("snap_indicator")
-            # Remove the last point if one was placed
-            if self.original_image:
-                self.display_image(keep_view_position=False)
+            # Remove the point ovals already placed for the aborted line
+            if self._current_point_ids:
+                self.canvas.delete(*self._current_point_ids)
+                self._current_point_ids = []
     
     def show_shortcuts(self):
         """Display keyboard shortcuts dialog"""
@@ -1341,16 +1873,42 @@ TIPS:
         messagebox.showinfo("Keyboard Shortcuts", shortcuts_text)
     
     def open_settings_dialog(self):
-        """Open comprehensive settings dialog"""
+        """Open comprehensive settings dialog.
+
+        The window is built once and kept resident: closing it just
+        withdraws it, and later opens deiconify and resync the widgets
+        from the settings, skipping the whole widget-tree rebuild.
+        """
+        # Snapshot now, not at Save time: the color pickers write into
+        # self.settings as soon as a color is chosen, and the redraw
+        # decision in _apply_settings_dialog diffs against this snapshot
+        self._settings_before = dict(self.settings)
+
+        if (self._settings_window is not None
+                and self._settings_window.winfo_exists()):
+            for refresh in self._settings_refreshers:
+                refresh()
+            self._settings_window.deiconify()
+            self._settings_window.grab_set()
+            return
+
         settings_window = tk.Toplevel(self.root)
         settings_window.title("Preferences")
         settings_window.geometry("600x700")
         settings_window.transient(self.root)
         settings_window.grab_set()
+        settings_window.protocol("WM_DELETE_WINDOW", self._close_settings_dialog)
+        self._settings_window = settings_window
         
-        # Create notebook for tabs
+        # Create notebook for tabs. Only the visible Colors tab is built
+        # up front; the other pages are empty frames populated on first
+        # selection so the dialog pops up without building every widget
         notebook = ttk.Notebook(settings_window)
         notebook.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+
+        # Fresh build: drop references from any previously destroyed dialog
+        self._settings_widgets = {}
+        self._settings_refreshers = []
         
         # Colors tab
         colors_frame = ttk.Frame(notebook, padding=10)
@@ -1378,120 +1936,222 @@ TIPS:
         self.create_color_setting(canvas_group, "Background Color:", 'canvas_bg_color', 0)
         self.create_color_setting(canvas_group, "Label Background:", 'label_bg_color', 1)
         
-        # Line Settings tab
-        lines_frame = ttk.Frame(notebook, padding=10)
-        notebook.add(lines_frame, text="Lines & Points")
+        # Deferred tabs: placeholder frames plus their builders
+        builders = {}
+        for title, builder in (
+                ("Lines & Points", self._build_settings_lines_tab),
+                ("Text", self._build_settings_text_tab),
+                ("Display", self._build_settings_display_tab)):
+            frame = ttk.Frame(notebook, padding=10)
+            notebook.add(frame, text=title)
+            builders[str(frame)] = (frame, builder)
+
+        def on_tab_changed(event):
+            entry = builders.pop(notebook.select(), None)
+            if entry is not None:
+                entry[1](entry[0])
+
+        notebook.bind("<<NotebookTabChanged>>", on_tab_changed)
+
+        # Buttons
+        button_frame = ttk.Frame(settings_window)
+        button_frame.pack(side=tk.BOTTOM, fill=tk.X, padx=10, pady=10)
         
-        # Line widths
+        ttk.Button(button_frame, text="Save",
+                   command=self._apply_settings_dialog).pack(side=tk.RIGHT, padx=5)
+        ttk.Button(button_frame, text="Cancel",
+                   command=self._close_settings_dialog).pack(side=tk.RIGHT, padx=5)
+
+    def _close_settings_dialog(self):
+        """Hide the resident Preferences window"""
+        if self._settings_window is not None:
+            self._settings_window.grab_release()
+            self._settings_window.withdraw()
+
+    def _settings_var(self, key, setting):
+        """Persistent BooleanVar for a dialog checkbox.
+
+        Tk variables register Tcl traces, so they're created once and
+        reused across dialog opens, just refreshed from the settings.
+        """
+        var = self._settings_vars.get(key)
+        if var is None:
+            var = tk.BooleanVar()
+            self._settings_vars[key] = var
+        var.set(self.settings[setting])
+        return var
+
+    def _settings_int_var(self, key, setting):
+        """Persistent IntVar backing a dialog Spinbox.
+
+        Reading the variable returns an int directly, skipping the
+        string round-trip of Spinbox.get() plus int() on every Save.
+        """
+        var = self._settings_vars.get(key)
+        if var is None:
+            var = tk.IntVar()
+            self._settings_vars[key] = var
+        var.set(self.settings[setting])
+        return var
+
+    def _apply_settings_dialog(self):
+        """Read the dialog widgets back into settings and apply them.
+
+        Widgets from never-opened tabs don't exist, in which case their
+        settings simply keep their current values.
+        """
+        w = self._settings_widgets
+        v = self._settings_vars
+        before = self._settings_before or {}
+
+        def read_int(key, setting):
+            var = v.get(key)
+            if var is not None:
+                self.settings[setting] = var.get()
+
+        def read_var(key, setting):
+            var = v.get(key)
+            if var is not None and w.get(key):
+                self.settings[setting] = var.get()
+
+        read_int('calib_width', 'calibration_line_width')
+        read_int('measure_width', 'measurement_line_width')
+        read_int('point_size', 'point_size')
+        if w.get('font_combo') is not None:
+            self.settings['measurement_text_font'] = w['font_combo'].get()
+        read_int('font_size', 'measurement_text_size')
+        # Label font settings may have changed; rebuild lazily
+        self._label_font = None
+        read_var('show_labels', 'show_measurement_labels')
+        read_var('label_bg', 'label_background')
+        read_var('show_crosshair', 'show_crosshair')
+        read_int('crosshair_width', 'crosshair_width')
+        read_var('show_rulers', 'show_rulers')
+        self._refresh_setting_cache()
+
+        # Update canvas background
+        self.canvas.config(bg=self.settings['canvas_bg_color'])
+
+        # Update menu checkboxes
+        self.show_crosshair_var.set(self.settings['show_crosshair'])
+        self.show_rulers_var.set(self.settings['show_rulers'])
+
+        # Save to file
+        self.save_settings()
+
+        # Redraw only if something the canvas actually shows changed
+        changed = {k for k, v in self.settings.items() if before.get(k) != v}
+        if changed & _AFFECTS_DISPLAY and self.original_image:
+            self.display_image(keep_view_position=False)
+
+        self._close_settings_dialog()
+        messagebox.showinfo("Settings Saved", "Settings have been saved and applied!")
+
+    def _build_settings_lines_tab(self, lines_frame):
+        """Populate the Lines & Points preferences tab on first view"""
         ttk.Label(lines_frame, text="Calibration Line Width:").grid(row=0, column=0, sticky=tk.W, pady=5)
-        calib_width = ttk.Spinbox(lines_frame, from_=1, to=10, width=10)
-        calib_width.set(self.settings['calibration_line_width'])
+        calib_width_var = self._settings_int_var('calib_width', 'calibration_line_width')
+        calib_width = ttk.Spinbox(lines_frame, from_=1, to=10, width=10,
+                                  textvariable=calib_width_var)
         calib_width.grid(row=0, column=1, padx=5, pady=5)
         
         ttk.Label(lines_frame, text="Measurement Line Width:").grid(row=1, column=0, sticky=tk.W, pady=5)
-        measure_width = ttk.Spinbox(lines_frame, from_=1, to=10, width=10)
-        measure_width.set(self.settings['measurement_line_width'])
+        measure_width_var = self._settings_int_var('measure_width', 'measurement_line_width')
+        measure_width = ttk.Spinbox(lines_frame, from_=1, to=10, width=10,
+                                    textvariable=measure_width_var)
         measure_width.grid(row=1, column=1, padx=5, pady=5)
         
         ttk.Label(lines_frame, text="Point Size:").grid(row=2, column=0, sticky=tk.W, pady=5)
-        point_size = ttk.Spinbox(lines_frame, from_=2, to=10, width=10)
-        point_size.set(self.settings['point_size'])
+        point_size_var = self._settings_int_var('point_size', 'point_size')
+        point_size = ttk.Spinbox(lines_frame, from_=2, to=10, width=10,
+                                 textvariable=point_size_var)
         point_size.grid(row=2, column=1, padx=5, pady=5)
-        
-        # Text Settings tab
-        text_frame = ttk.Frame(notebook, padding=10)
-        notebook.add(text_frame, text="Text")
-        
+
+        def refresh():
+            calib_width_var.set(self.settings['calibration_line_width'])
+            measure_width_var.set(self.settings['measurement_line_width'])
+            point_size_var.set(self.settings['point_size'])
+        self._settings_refreshers.append(refresh)
+
+    def _build_settings_text_tab(self, text_frame):
+        """Populate the Text preferences tab on first view"""
+        w = self._settings_widgets
+
         ttk.Label(text_frame, text="Font:").grid(row=0, column=0, sticky=tk.W, pady=5)
         font_combo = ttk.Combobox(text_frame, values=["Arial", "Helvetica", "Times", "Courier"], 
                                  state="readonly", width=15)
         font_combo.set(self.settings['measurement_text_font'])
         font_combo.grid(row=0, column=1, padx=5, pady=5)
+        w['font_combo'] = font_combo
         
         ttk.Label(text_frame, text="Font Size:").grid(row=1, column=0, sticky=tk.W, pady=5)
-        font_size = ttk.Spinbox(text_frame, from_=6, to=24, width=10)
-        font_size.set(self.settings['measurement_text_size'])
+        font_size_var = self._settings_int_var('font_size', 'measurement_text_size')
+        font_size = ttk.Spinbox(text_frame, from_=6, to=24, width=10,
+                                textvariable=font_size_var)
         font_size.grid(row=1, column=1, padx=5, pady=5)
         
-        show_labels_var = tk.BooleanVar(value=self.settings['show_measurement_labels'])
+        show_labels_var = self._settings_var('show_labels', 'show_measurement_labels')
         ttk.Checkbutton(text_frame, text="Show Measurement Labels", 
                        variable=show_labels_var).grid(row=2, column=0, columnspan=2, sticky=tk.W, pady=5)
+        w['show_labels'] = True
         
-        label_bg_var = tk.BooleanVar(value=self.settings['label_background'])
+        label_bg_var = self._settings_var('label_bg', 'label_background')
         ttk.Checkbutton(text_frame, text="Label Background", 
                        variable=label_bg_var).grid(row=3, column=0, columnspan=2, sticky=tk.W, pady=5)
-        
-        # Display Settings tab
-        display_frame = ttk.Frame(notebook, padding=10)
-        notebook.add(display_frame, text="Display")
-        
+        w['label_bg'] = True
+
+        def refresh():
+            font_combo.set(self.settings['measurement_text_font'])
+            font_size_var.set(self.settings['measurement_text_size'])
+            show_labels_var.set(self.settings['show_measurement_labels'])
+            label_bg_var.set(self.settings['label_background'])
+        self._settings_refreshers.append(refresh)
+
+    def _build_settings_display_tab(self, display_frame):
+        """Populate the Display preferences tab on first view"""
+        w = self._settings_widgets
+
         # Crosshair settings
         crosshair_group = ttk.LabelFrame(display_frame, text="Crosshair", padding=10)
         crosshair_group.pack(fill=tk.X, pady=5)
         
-        show_crosshair_var = tk.BooleanVar(value=self.settings['show_crosshair'])
+        show_crosshair_var = self._settings_var('show_crosshair', 'show_crosshair')
         ttk.Checkbutton(crosshair_group, text="Show Crosshair", 
                        variable=show_crosshair_var).grid(row=0, column=0, columnspan=2, sticky=tk.W, pady=5)
+        w['show_crosshair'] = True
         
         self.create_color_setting(crosshair_group, "Crosshair Color:", 'crosshair_color', 1)
         
         ttk.Label(crosshair_group, text="Crosshair Width:").grid(row=2, column=0, sticky=tk.W, pady=5)
-        crosshair_width = ttk.Spinbox(crosshair_group, from_=1, to=3, width=10)
-        crosshair_width.set(self.settings['crosshair_width'])
+        crosshair_width_var = self._settings_int_var('crosshair_width', 'crosshair_width')
+        crosshair_width = ttk.Spinbox(crosshair_group, from_=1, to=3, width=10,
+                                      textvariable=crosshair_width_var)
         crosshair_width.grid(row=2, column=1, padx=5, pady=5)
         
         # Ruler settings
         ruler_group = ttk.LabelFrame(display_frame, text="Rulers", padding=10)
         ruler_group.pack(fill=tk.X, pady=5)
         
-        show_rulers_var = tk.BooleanVar(value=self.settings['show_rulers'])
+        show_rulers_var = self._settings_var('show_rulers', 'show_rulers')
         ttk.Checkbutton(ruler_group, text="Show Rulers", 
                        variable=show_rulers_var).grid(row=0, column=0, columnspan=2, sticky=tk.W, pady=5)
+        w['show_rulers'] = True
         
         self.create_color_setting(ruler_group, "Ruler Color:", 'ruler_color', 1)
-        
-        # Save function
-        def save_settings():
-            self.settings['calibration_line_width'] = int(calib_width.get())
-            self.settings['measurement_line_width'] = int(measure_width.get())
-            self.settings['point_size'] = int(point_size.get())
-            self.settings['measurement_text_font'] = font_combo.get()
-            self.settings['measurement_text_size'] = int(font_size.get())
-            self.settings['show_measurement_labels'] = show_labels_var.get()
-            self.settings['label_background'] = label_bg_var.get()
-            self.settings['show_crosshair'] = show_crosshair_var.get()
-            self.settings['crosshair_width'] = int(crosshair_width.get())
-            self.settings['show_rulers'] = show_rulers_var.get()
-            
-            # Update canvas background
-            self.canvas.config(bg=self.settings['canvas_bg_color'])
-            
-            # Update menu checkboxes
-            self.show_crosshair_var.set(self.settings['show_crosshair'])
-            self.show_rulers_var.set(self.settings['show_rulers'])
-            
-            # Save to file
-            self.save_settings()
-            
-            # Redraw everything
-            if self.original_image:
-                self.display_image(keep_view_position=False)
-            
-            settings_window.destroy()
-            messagebox.showinfo("Settings Saved", "Settings have been saved and applied!")
-        
-        # Buttons
-        button_frame = ttk.Frame(settings_window)
-        button_frame.pack(side=tk.BOTTOM, fill=tk.X, padx=10, pady=10)
-        
-        ttk.Button(button_frame, text="Save", command=save_settings).pack(side=tk.RIGHT, padx=5)
-        ttk.Button(button_frame, text="Cancel", command=settings_window.destroy).pack(side=tk.RIGHT, padx=5)
+
+        def refresh():
+            show_crosshair_var.set(self.settings['show_crosshair'])
+            crosshair_width_var.set(self.settings['crosshair_width'])
+            show_rulers_var.set(self.settings['show_rulers'])
+        self._settings_refreshers.append(refresh)
     
     def create_color_setting(self, parent, label, setting_key, row):
         """Create a color picker setting row"""
         ttk.Label(parent, text=label).grid(row=row, column=0, sticky=tk.W, padx=5, pady=5)
         
-        color_display = tk.Canvas(parent, width=30, height=20, bg=self.settings[setting_key], 
+        # A plain Label is a much lighter widget than a Canvas and renders
+        # a solid swatch just as well
+        color_display = tk.Label(parent, width=4, bg=self.settings[setting_key],
                                  relief=tk.SUNKEN, bd=1)
         color_display.grid(row=row, column=1, padx=5, pady=5)
         
@@ -1500,9 +2160,14 @@ TIPS:
                                          title=f"Choose {label}")
             if color[1]:
                 self.settings[setting_key] = color[1]
+                self._refresh_setting_cache()
                 color_display.config(bg=color[1])
         
         ttk.Button(parent, text="Choose...", command=choose_color).grid(row=row, column=2, padx=5, pady=5)
+
+        # Keep the swatch in sync when the resident dialog is reopened
+        self._settings_refreshers.append(
+            lambda: color_display.config(bg=self.settings[setting_key]))
     
     def customize_measurement(self, index):
         """Customize a specific measurement"""
@@ -1595,29 +2260,75 @@ TIPS:
     def delete_measurement(self, index):
         """Delete a specific measurement"""
         if index < len(self.measurements):
-            del self.measurements[index]
-            if self.original_image:
+            removed = self.measurements.pop(index)
+            self._invalidate_segments()
+            canvas_ids = removed.get('canvas_ids')
+            if canvas_ids:
+                self.canvas.delete(*canvas_ids)
+            elif self.original_image:
                 self.display_image(keep_view_position=False)
             self.update_measurements_display()
     
+    def _refresh_setting_cache(self):
+        """Mirror hot-path settings onto plain attributes.
+
+        The mouse-move handlers read these every pointer frame; a plain
+        attribute load is cheaper than a dict lookup on self.settings,
+        and the cache is refreshed whenever settings change.
+        """
+        s = self.settings
+        self._show_crosshair = s['show_crosshair']
+        self._show_rulers = s['show_rulers']
+        self._calib_line_color = s['calibration_line_color']
+        self._measure_line_color = s['measurement_line_color']
+        self._ruler_color = s['ruler_color']
+
     def load_settings(self):
         """Load settings from file"""
         settings_file = os.path.join(os.path.dirname(__file__), 'blueprint_settings.json')
         if os.path.exists(settings_file):
             try:
-                with open(settings_file, 'r') as f:
-                    saved_settings = json.load(f)
-                    # Update settings with saved values
-                    self.settings.update(saved_settings)
+                if ORJSON_AVAILABLE:
+                    with open(settings_file, 'rb') as f:
+                        saved_settings = orjson.loads(f.read())
+                else:
+                    with open(settings_file, 'r') as f:
+                        saved_settings = json.load(f)
+                # Update settings with saved values
+                self.settings.update(saved_settings)
+                self._last_saved_settings = self.settings.copy()
             except Exception as e:
                 print(f"Could not load settings: {e}")
     
     def save_settings(self):
-        """Save settings to file"""
+        """Schedule a settings write, coalescing rapid changes.
+
+        Quick toggles used to hit the disk on every click; now they re-arm
+        a short timer and only the final state is written.
+        """
+        if self._settings_save_after is not None:
+            self.root.after_cancel(self._settings_save_after)
+        self._settings_save_after = self.root.after(500, self._flush_settings)
+
+    def _flush_settings(self):
+        """Write settings to disk atomically, skipping no-op writes"""
+        self._settings_save_after = None
+        if self.settings == self._last_saved_settings:
+            return
         settings_file = os.path.join(os.path.dirname(__file__), 'blueprint_settings.json')
         try:
-            with open(settings_file, 'w') as f:
-                json.dump(self.settings, f, indent=4)
+            # Write to a sibling temp file and rename over the target so a
+            # crash mid-write can't leave a truncated settings file
+            tmp_file = settings_file + '.tmp'
+            if ORJSON_AVAILABLE:
+                with open(tmp_file, 'wb') as f:
+                    f.write(orjson.dumps(self.settings,
+                                         option=orjson.OPT_INDENT_2))
+            else:
+                with open(tmp_file, 'w') as f:
+                    json.dump(self.settings, f, indent=4)
+            os.replace(tmp_file, settings_file)
+            self._last_saved_settings = self.settings.copy()
         except Exception as e:
             print(f"Could not save settings: {e}")
     
@@ -1625,32 +2336,9 @@ TIPS:
         """Reset settings to defaults"""
         if messagebox.askyesno("Reset Settings", 
                               "Are you sure you want to reset all settings to defaults?"):
-            self.settings = {
-                'calibration_line_color': '#FF0000',
-                'calibration_point_color': '#FF0000',
-                'calibration_line_width': 2,
-                'measurement_line_color': '#0000FF',
-                'measurement_point_color': '#0000FF',
-                'measurement_line_width': 2,
-                'measurement_text_color': '#0000FF',
-                'measurement_text_size': 10,
-                'measurement_text_font': 'Arial',
-                'canvas_bg_color': '#808080',
-                'point_size': 4,
-                'show_measurement_labels': True,
-                'label_background': True,
-                'label_bg_color': '#FFFFFF',
-                'grid_enabled': False,
-                'grid_color': '#CCCCCC',
-                'grid_spacing': 50,
-                'show_crosshair': True,
-                'crosshair_color': '#00FF00',
-                'crosshair_width': 1,
-                'show_rulers': True,
-                'ruler_color': '#000000',
-                'ruler_bg_color': '#E0E0E0',
-                'ruler_size': 30
-            }
+            self.settings = dict(_DEFAULT_SETTINGS)
+            self._refresh_setting_cache()
+            self._label_font = None
             self.save_settings()
             self.canvas.config(bg=self.settings['canvas_bg_color'])
             self.show_crosshair_var.set(self.settings['show_crosshair'])
@@ -1662,16 +2350,26 @@ TIPS:
     def toggle_crosshair(self):
         """Toggle crosshair visibility"""
         self.settings['show_crosshair'] = self.show_crosshair_var.get()
+        self._show_crosshair = self.settings['show_crosshair']
         if not self.settings['show_crosshair']:
-            self.canvas.delete("crosshair")
+            self._hide_crosshair()
             self.canvas.delete("ruler_coords")
+            self._last_ruler_ixy = None
         self.save_settings()
     
     def toggle_rulers(self):
         """Toggle ruler visibility"""
         self.settings['show_rulers'] = self.show_rulers_var.get()
-        if self.original_image:
-            self.display_image(keep_view_position=False)
+        self._show_rulers = self.settings['show_rulers']
+        # Rulers are independent canvas items; add or remove just them
+        # instead of rebuilding the whole display
+        if self._show_rulers:
+            self._refresh_rulers()
+        else:
+            self.canvas.delete("ruler")
+            self.canvas.delete("ruler_coords")
+            self._ruler_range = None
+            self._last_ruler_ixy = None
         self.save_settings()
     
     def show_about(self):
@@ -1717,97 +2415,143 @@ Made with ❤ by Abdullah Noor
         
         if not file_path:
             return
-        
+
+        from datetime import datetime
+
         try:
             # Create a copy of the original image at current zoom
             img_width, img_height = self.original_image.size
             final_scale = self.base_scale * self.zoom_level
-            export_width = int(img_width * final_scale)
-            export_height = int(img_height * final_scale)
-            
-            # Resize the original image to current zoom level
-            export_image = self.original_image.resize((export_width, export_height), 
-                                                      Image.Resampling.LANCZOS)
+
+            # When the view is at or below native resolution, export at
+            # native resolution instead: downscaling would only throw
+            # pixels away, and skipping the LANCZOS resample avoids
+            # allocating and filtering a second full-size buffer
+            if final_scale <= 1.0:
+                final_scale = 1.0
+                export_width, export_height = img_width, img_height
+                export_image = self.original_image.copy()
+            else:
+                export_width = int(img_width * final_scale)
+                export_height = int(img_height * final_scale)
+                # Rounding can land the target within a pixel of the
+                # source size; resizing then is a full LANCZOS pass for
+                # no visible change, so treat it as identity too
+                if (abs(export_width - img_width) <= 1
+                        and abs(export_height - img_height) <= 1):
+                    export_width, export_height = img_width, img_height
+                    export_image = self.original_image.copy()
+                else:
+                    export_image = self.original_image.resize(
+                        (export_width, export_height),
+                        Image.Resampling.LANCZOS)
             
             # Create a drawing context
             draw = ImageDraw.Draw(export_image)
             
-            # Try to load a font, fallback to default if not available
-            try:
-                font_size = self.settings['measurement_text_size']
-                font = ImageFont.truetype("arial.ttf", font_size)
-                small_font = ImageFont.truetype("arial.ttf", 8)
-            except:
-                font = ImageFont.load_default()
-                small_font = ImageFont.load_default()
+            # Cached font load, falling back to the default if the TTF
+            # is not available
+            font = _get_export_font("arial.ttf", self.settings['measurement_text_size'])
+            small_font = _get_export_font("arial.ttf", 8)
             
-            # Draw calibration line if present
+            # Draw calibration line if present (stored points are in
+            # source-image pixels; scale them to the export resolution)
             if len(self.calibration_points) == 2:
-                p1 = self.calibration_points[0]
-                p2 = self.calibration_points[1]
+                p1 = (self.calibration_points[0][0] * final_scale,
+                      self.calibration_points[0][1] * final_scale)
+                p2 = (self.calibration_points[1][0] * final_scale,
+                      self.calibration_points[1][1] * final_scale)
                 
                 # Draw line
                 draw.line([p1, p2], 
-                         fill=self.settings['calibration_line_color'],
+                         fill=_rgb(self.settings['calibration_line_color']),
                          width=self.settings['calibration_line_width'])
                 
                 # Draw points
                 point_size = self.settings['point_size']
+                calib_point_rgb = _rgb(self.settings['calibration_point_color'])
                 draw.ellipse([p1[0]-point_size, p1[1]-point_size, 
                              p1[0]+point_size, p1[1]+point_size],
-                            fill=self.settings['calibration_point_color'])
-                draw.ellipse([p2[0]-point_size, p2[1]-point_size, 
-                             p2[0]+point_size, p2[1]+point_size],
-                            fill=self.settings['calibration_point_color'])
-            
-            # Draw all measurements
-            for i, measurement in enumerate(self.measurements):
-                p1, p2 = measurement['points']
-                
-                line_color = measurement.get('line_color', self.settings['measurement_line_color'])
-                point_color = measurement.get('point_color', self.settings['measurement_point_color'])
-                line_width = measurement.get('line_width', self.settings['measurement_line_width'])
-                text_color = measurement.get('text_color', self.settings['measurement_text_color'])
-                
-                # Draw line
-                draw.line([p1, p2], fill=line_color, width=line_width)
-                
-                # Draw points
-                point_size = self.settings['point_size']
-                draw.ellipse([p1[0]-point_size, p1[1]-point_size, 
-                             p1[0]+point_size, p1[1]+point_size],
-                            fill=point_color)
+                            fill=calib_point_rgb)
                 draw.ellipse([p2[0]-point_size, p2[1]-point_size, 
                              p2[0]+point_size, p2[1]+point_size],
-                            fill=point_color)
-                
-                # Draw label if enabled
-                if self.settings['show_measurement_labels']:
-                    mid_x = (p1[0] + p2[0]) / 2
-                    mid_y = (p1[1] + p2[1]) / 2
-                    
-                    display_distance = self.convert_unit(measurement['distance'], 
-                                                        self.unit, 
-                                                        self.display_unit_var.get())
-                    text = f"{display_distance:.2f} {self.display_unit_var.get()}"
-                    
-                    # Get text bounding box
-                    bbox = draw.textbbox((mid_x, mid_y - 10), text, font=font)
-                    
-                    # Draw background if enabled
-                    if self.settings['label_background']:
-                        padding = 2
-                        draw.rectangle([bbox[0]-padding, bbox[1]-padding, 
-                                      bbox[2]+padding, bbox[3]+padding],
-                                     fill=self.settings['label_bg_color'])
-                    
-                    # Draw text
-                    draw.text((mid_x, mid_y - 10), text, 
-                             fill=text_color, font=font, anchor="mm")
+                            fill=calib_point_rgb)
+            
+            # Draw all measurements, with the per-iteration settings
+            # lookups, style defaults and unit factor hoisted out front
+            settings = self.settings
+            def_line_color = settings['measurement_line_color']
+            def_point_color = settings['measurement_point_color']
+            def_line_width = settings['measurement_line_width']
+            def_text_color = settings['measurement_text_color']
+            point_size = settings['point_size']
+            show_labels = settings['show_measurement_labels']
+            label_bg = settings['label_background']
+            label_bg_color = _rgb(settings['label_bg_color'])
+            display_unit = self.display_unit_var.get()
+            unit_factor = self.convert_unit(1.0, "meters", display_unit)
+
+            # Bucket the geometry by style so each distinct
+            # (line color, width, point color) resolves its colors once;
+            # PIL re-parses a color string on every call otherwise. A
+            # single multi-point draw.line per bucket would be cheaper
+            # still, but it would join disjoint segments, so each segment
+            # keeps its own call.
+            buckets = {}
+            labels = []
+            for measurement in self.measurements:
+                (ix1, iy1), (ix2, iy2) = measurement['points']
+                p1 = (ix1 * final_scale, iy1 * final_scale)
+                p2 = (ix2 * final_scale, iy2 * final_scale)
+
+                style = (measurement.get('line_color', def_line_color),
+                         measurement.get('line_width', def_line_width),
+                         measurement.get('point_color', def_point_color))
+                segs, boxes = buckets.setdefault(style, ([], []))
+                segs.append((p1, p2))
+                # Endpoint marker bboxes are fixed by the geometry, so
+                # compute them here and keep the emit loop draw-only
+                x1, y1 = p1
+                x2, y2 = p2
+                boxes.append([x1 - point_size, y1 - point_size,
+                              x1 + point_size, y1 + point_size])
+                boxes.append([x2 - point_size, y2 - point_size,
+                              x2 + point_size, y2 + point_size])
+
+                if show_labels:
+                    display_distance = measurement['distance'] * unit_factor
+                    labels.append(((p1[0] + p2[0]) / 2, (p1[1] + p2[1]) / 2,
+                                   f"{display_distance:.2f} {display_unit}",
+                                   measurement.get('text_color',
+                                                   def_text_color)))
+
+            line = draw.line
+            ellipse = draw.ellipse
+            for (line_color, line_width, point_color), (segs, boxes) \
+                    in buckets.items():
+                line_rgb = _rgb(line_color)
+                point_rgb = _rgb(point_color)
+                for p1, p2 in segs:
+                    line([p1, p2], fill=line_rgb, width=line_width)
+                for box in boxes:
+                    ellipse(box, fill=point_rgb)
+
+            # Labels go on last so they sit above every line and point
+            for mid_x, mid_y, text, text_color in labels:
+                bbox = draw.textbbox((mid_x, mid_y - 10), text, font=font)
+                if label_bg:
+                    padding = 2
+                    draw.rectangle([bbox[0]-padding, bbox[1]-padding, 
+                                  bbox[2]+padding, bbox[3]+padding],
+                                 fill=label_bg_color)
+                draw.text((mid_x, mid_y - 10), text, 
+                         fill=_rgb(text_color), font=font, anchor="mm")
             
             # Draw rulers if enabled
             if self.settings['show_rulers'] and self.base_scale_factor:
-                self.draw_rulers_on_image(draw, export_width, export_height, small_font)
+                self.draw_rulers_on_image(draw, export_width, export_height,
+                                          small_font,
+                                          self.image_scale_factor * final_scale)
             
             # Add watermark/info
             info_text = f"Blueprint Measurement Tool | {datetime.now().strftime('%Y-%m-%d %H:%M')}"
@@ -1822,62 +2566,85 @@ Made with ❤ by Abdullah Noor
             draw.text((10, export_height - 20), info_text, 
                      fill='black', font=small_font)
             
-            # Save the image
-            export_image.save(file_path)
-            messagebox.showinfo("Export Successful", 
-                              f"Labelled image saved to:\n{file_path}")
-            
+            # Encode and write off the Tk thread: the PNG/TIFF encoder
+            # can block for seconds on large images, and PIL needs no UI
+            # access once drawing is done. A single worker keeps saves
+            # ordered if the user exports again immediately.
+            save_kwargs = {}
+            if file_path.lower().endswith('.png'):
+                # Blueprints are mostly flat color and compress well at
+                # any level; the low setting encodes several times faster
+                save_kwargs = {'optimize': False, 'compress_level': 1}
+            if self._export_executor is None:
+                self._export_executor = concurrent.futures.ThreadPoolExecutor(
+                    max_workers=1)
+            future = self._export_executor.submit(
+                export_image.save, file_path, **save_kwargs)
+
+            def check_done():
+                if not future.done():
+                    self.root.after(100, check_done)
+                    return
+                error = future.exception()
+                if error is not None:
+                    messagebox.showerror(
+                        "Export Error",
+                        f"Failed to export image:\n{str(error)}")
+                else:
+                    messagebox.showinfo(
+                        "Export Successful",
+                        f"Labelled image saved to:\n{file_path}")
+
+            self.root.after(100, check_done)
+
         except Exception as e:
             messagebox.showerror("Export Error", f"Failed to export image:\n{str(e)}")
     
-    def draw_rulers_on_image(self, draw, width, height, font):
-        """Draw ruler markings on the exported image"""
+    def draw_rulers_on_image(self, draw, width, height, font,
+                             scale_factor=None):
+        """Draw ruler markings on the exported image.
+
+        scale_factor is pixels-per-unit at the target resolution; it
+        defaults to the on-screen scale for compatibility.
+        """
         if not self.base_scale_factor:
             return
-        
-        current_scale_factor = self.base_scale_factor * self.zoom_level
+
+        current_scale_factor = (scale_factor if scale_factor is not None
+                                else self.base_scale_factor * self.zoom_level)
         real_per_100px = 100 / current_scale_factor
         
-        # Find nice tick spacing
-        nice_numbers = [0.1, 0.2, 0.5, 1, 2, 5, 10, 20, 50, 100, 200, 500, 1000]
-        tick_spacing_real = min(nice_numbers, key=lambda x: abs(x - real_per_100px))
+        # Find nice tick spacing (same closed-form picker as the
+        # on-screen rulers; no list scan)
+        tick_spacing_real = self._nice_tick_spacing(real_per_100px)
         tick_spacing_px = tick_spacing_real * current_scale_factor
         
-        ruler_color = self.settings['ruler_color']
-        
-        # Draw horizontal ruler marks (top)
-        x = 0
-        tick_num = 0
-        while x <= width:
-            is_major = (tick_num % 5 == 0)
+        ruler_color = _rgb(self.settings['ruler_color'])
+        inv_scale = 1.0 / current_scale_factor
+
+        # Precompute the tick positions and major labels for each axis up
+        # front (the real-distance labels are just multiples of the tick
+        # spacing), then emit the draw calls in one tight pass per axis
+        line = draw.line
+        text = draw.text
+
+        x_ticks = [(i * tick_spacing_px, i % 5 == 0)
+                   for i in range(int(width / tick_spacing_px) + 1)]
+        for x, is_major in x_ticks:
             tick_height = 15 if is_major else 8
-            
-            draw.line([(x, 0), (x, tick_height)], fill=ruler_color, width=1)
-            
+            line([(x, 0), (x, tick_height)], fill=ruler_color, width=1)
             if is_major:
-                real_distance = x / current_scale_factor
-                draw.text((x, tick_height + 2), f"{real_distance:.1f}", 
-                         fill=ruler_color, font=font, anchor="mt")
-            
-            x += tick_spacing_px
-            tick_num += 1
-        
-        # Draw vertical ruler marks (left)
-        y = 0
-        tick_num = 0
-        while y <= height:
-            is_major = (tick_num % 5 == 0)
+                text((x, tick_height + 2), f"{x * inv_scale:.1f}",
+                     fill=ruler_color, font=font, anchor="mt")
+
+        y_ticks = [(i * tick_spacing_px, i % 5 == 0)
+                   for i in range(int(height / tick_spacing_px) + 1)]
+        for y, is_major in y_ticks:
             tick_width = 15 if is_major else 8
-            
-            draw.line([(0, y), (tick_width, y)], fill=ruler_color, width=1)
-            
+            line([(0, y), (tick_width, y)], fill=ruler_color, width=1)
             if is_major and y > 20:  # Avoid overlap with horizontal ruler
-                real_distance = y / current_scale_factor
-                draw.text((tick_width + 2, y), f"{real_distance:.1f}", 
-                         fill=ruler_color, font=font, anchor="lm")
-            
-            y += tick_spacing_px
-            tick_num += 1
+                text((tick_width + 2, y), f"{y * inv_scale:.1f}",
+                     fill=ruler_color, font=font, anchor="lm")
     
     def export_measurements_csv(self):
         """Export measurements to a CSV file"""
@@ -1897,52 +2664,58 @@ Made with ❤ by Abdullah Noor
         
         if not file_path:
             return
-        
+
+        import csv
+        from datetime import datetime
+
         try:
-            with open(file_path, 'w', newline='', encoding='utf-8') as csvfile:
+            display_unit = self.display_unit_var.get()
+            def_line_color = self.settings['measurement_line_color']
+            def_line_width = self.settings['measurement_line_width']
+
+            # Data rows contain only numbers and hex colors — nothing
+            # that needs quoting — so they're formatted directly and
+            # written as one string, bypassing per-field csv dialect
+            # dispatch. The header and summary keep the csv writer.
+            distances = self._distance_list()
+            converted = self.convert_units_batch(distances, "meters",
+                                                 display_unit)
+            data_lines = "\r\n".join(
+                f"{i},{distance:.3f},"
+                f"{m['points'][0][0]:.1f},{m['points'][0][1]:.1f},"
+                f"{m['points'][1][0]:.1f},{m['points'][1][1]:.1f},"
+                f"{m.get('line_color', def_line_color)},"
+                f"{m.get('line_width', def_line_width)}"
+                for i, (m, distance) in enumerate(
+                    zip(self.measurements, converted), 1)
+            )
+
+            total_converted = self.convert_unit(sum(distances), "meters",
+                                                display_unit)
+            summary_rows = [
+                [],
+                ['Summary'],
+                ['Total Measurements', len(self.measurements)],
+                ['Total Distance', f"{total_converted:.3f} {display_unit}"],
+                ['Calibration Unit', self.unit],
+                ['Export Date', datetime.now().strftime('%Y-%m-%d %H:%M:%S')]
+            ]
+
+            with open(file_path, 'w', newline='', encoding='utf-8',
+                      buffering=1 << 20) as csvfile:
                 writer = csv.writer(csvfile)
-                
-                # Write header
                 writer.writerow([
                     'Measurement #',
-                    f'Distance ({self.display_unit_var.get()})',
-                    'Start X (px)',
-                    'Start Y (px)',
-                    'End X (px)',
-                    'End Y (px)',
+                    f'Distance ({display_unit})',
+                    'Start X (image px)',
+                    'Start Y (image px)',
+                    'End X (image px)',
+                    'End Y (image px)',
                     'Line Color',
                     'Line Width'
                 ])
-                
-                # Write measurements
-                for i, measurement in enumerate(self.measurements, 1):
-                    distance = self.convert_unit(measurement['distance'], 
-                                                self.unit, 
-                                                self.display_unit_var.get())
-                    p1, p2 = measurement['points']
-                    
-                    writer.writerow([
-                        i,
-                        f"{distance:.3f}",
-                        f"{p1[0]:.1f}",
-                        f"{p1[1]:.1f}",
-                        f"{p2[0]:.1f}",
-                        f"{p2[1]:.1f}",
-                        measurement.get('line_color', self.settings['measurement_line_color']),
-                        measurement.get('line_width', self.settings['measurement_line_width'])
-                    ])
-                
-                # Write summary
-                writer.writerow([])
-                writer.writerow(['Summary'])
-                writer.writerow(['Total Measurements', len(self.measurements)])
-                
-                total = sum(m['distance'] for m in self.measurements)
-                total_converted = self.convert_unit(total, self.unit, self.display_unit_var.get())
-                writer.writerow(['Total Distance', f"{total_converted:.3f} {self.display_unit_var.get()}"])
-                
-                writer.writerow(['Calibration Unit', self.unit])
-                writer.writerow(['Export Date', datetime.now().strftime('%Y-%m-%d %H:%M:%S')])
+                csvfile.write(data_lines + "\r\n")
+                writer.writerows(summary_rows)
             
             messagebox.showinfo("Export Successful", 
                               f"Measurements saved to:\n{file_path}")
@@ -1952,6 +2725,11 @@ Made with ❤ by Abdullah Noor
 
 
 def main():
+    # Log the Pillow build once so users running the optional Pillow-SIMD
+    # drop-in (see requirements.txt) can confirm which build is loaded.
+    import PIL
+    print(f"Pillow version: {PIL.__version__}")
+
     # Use TkinterDnD root if available, otherwise regular Tk
     if DND_AVAILABLE:
         root = TkinterDnD.Tk()